@@ -12,6 +12,10 @@ import time
 
 
 class GearMotorController:
+    # set_motor_speed 채널 번호 ('A'/'B' 문자열 대신 쓰면 문자열 비교가 없음)
+    CH_A = 0  # 모터 A (우측)
+    CH_B = 1  # 모터 B (좌측)
+
     def __init__(self):
         # 모터 A (우측) GPIO 핀 정의
         self.MOTOR_A_EN = 4  # PWM 속도 제어
@@ -23,6 +27,14 @@ class GearMotorController:
         self.MOTOR_B_PIN1 = 27  # 방향 제어 1
         self.MOTOR_B_PIN2 = 18  # 방향 제어 2
 
+        # 방향 핀 묶음 (set_motor_speeds에서 한 번에 출력)
+        self.MOTOR_DIR_PINS = (
+            self.MOTOR_A_PIN1,
+            self.MOTOR_A_PIN2,
+            self.MOTOR_B_PIN1,
+            self.MOTOR_B_PIN2,
+        )
+
         self.setup()
 
     def setup(self):
@@ -49,6 +61,24 @@ class GearMotorController:
         self.pwm_A.start(0)
         self.pwm_B.start(0)
 
+        # 채널 → (PWM, 방향 핀1, 방향 핀2) 표 (채널 번호와 'A'/'B' 모두 사용 가능)
+        channel_a = (self.pwm_A, self.MOTOR_A_PIN1, self.MOTOR_A_PIN2)
+        self._channel_b = (self.pwm_B, self.MOTOR_B_PIN1, self.MOTOR_B_PIN2)
+        self._channels = {
+            self.CH_A: channel_a,
+            self.CH_B: self._channel_b,
+            "A": channel_a,
+            "B": self._channel_b,
+        }
+
+    def set_pwm_freq(self, freq):
+        """
+        두 모터의 PWM 주파수 변경
+        :param freq: PWM 주파수 (Hz)
+        """
+        self.pwm_A.ChangeFrequency(freq)
+        self.pwm_B.ChangeFrequency(freq)
+
     def motor_stop(self):
         """모든 모터 정지"""
         # 모터 A 정지
@@ -64,17 +94,10 @@ class GearMotorController:
     def set_motor_speed(self, motor, speed):
         """
         모터 속도 설정
-        :param motor: 'A' 또는 'B' (우측/좌측 모터)
+        :param motor: CH_A/CH_B 또는 'A'/'B' (우측/좌측 모터)
         :param speed: -100 ~ 100 (음수: 후진, 양수: 전진)
         """
-        if motor == "A":
-            pwm = self.pwm_A
-            pin1 = self.MOTOR_A_PIN1
-            pin2 = self.MOTOR_A_PIN2
-        else:
-            pwm = self.pwm_B
-            pin1 = self.MOTOR_B_PIN1
-            pin2 = self.MOTOR_B_PIN2
+        pwm, pin1, pin2 = self._channels.get(motor, self._channel_b)
 
         # 속도 범위 제한
         speed = max(-100, min(100, speed))
@@ -92,6 +115,24 @@ class GearMotorController:
             GPIO.output(pin2, GPIO.LOW)
             pwm.ChangeDutyCycle(0)
 
+    def set_motor_speeds(self, a_speed, b_speed):
+        """
+        두 모터 속도를 한 번에 설정 (주행 루프용 빠른 경로)
+        :param a_speed: 모터 A(우측) 속도 -100 ~ 100
+        :param b_speed: 모터 B(좌측) 속도 -100 ~ 100
+        """
+        # 속도 범위 제한
+        a_speed = max(-100, min(100, a_speed))
+        b_speed = max(-100, min(100, b_speed))
+
+        # 방향 핀 4개를 GPIO.output 한 번으로 출력 (PIN1: 전진, PIN2: 후진)
+        GPIO.output(
+            self.MOTOR_DIR_PINS,
+            (a_speed > 0, a_speed < 0, b_speed > 0, b_speed < 0),
+        )
+        self.pwm_A.ChangeDutyCycle(abs(a_speed))
+        self.pwm_B.ChangeDutyCycle(abs(b_speed))
+
     def cleanup(self):
         """GPIO 설정 초기화"""
         self.motor_stop()
@@ -10,8 +10,17 @@
 import RPi.GPIO as GPIO
 import time
 
+# libgpiod가 있으면 센서 3개를 한 번에 읽음 (없으면 RPi.GPIO로 하나씩 읽음)
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
+
 
 class LineSensorController:
+    # 패턴(LMR 3비트) → 위치값 (get_line_position의 position_map과 같은 값)
+    POSITION_BY_PATTERN = (None, 1, 0, 0.5, -1, None, -0.5, 0)
+
     def __init__(self):
         # 라인 센서 GPIO 핀 정의
         self.LINE_PIN_RIGHT = 19
@@ -30,11 +39,45 @@ class LineSensorController:
         GPIO.setup(self.LINE_PIN_MIDDLE, GPIO.IN)
         GPIO.setup(self.LINE_PIN_LEFT, GPIO.IN)
 
+        self.lines = None
+        self.request_lines()
+
+    def request_lines(self):
+        """
+        좌/중/우 핀을 하나의 line request로 묶기 (한 번의 시스템 콜로 읽기)
+        gpiod가 없거나 요청이 실패하면 RPi.GPIO로 하나씩 읽음
+        """
+        if gpiod is None or self.lines is not None:
+            return
+        try:
+            chip = gpiod.Chip("gpiochip0")
+            lines = chip.get_lines(
+                [self.LINE_PIN_LEFT, self.LINE_PIN_MIDDLE, self.LINE_PIN_RIGHT]
+            )
+            lines.request(consumer="line_sensor", type=gpiod.LINE_REQ_DIR_IN)
+            self.lines = lines
+        except (AttributeError, OSError):
+            # v2 API 또는 권한 문제 → RPi.GPIO 사용
+            self.lines = None
+
+    def release_lines(self):
+        """
+        line request 해제 (핀을 계속 잡고 있으면 GPIO.add_event_detect가 실패함)
+        해제한 뒤에는 read_sensors가 RPi.GPIO로 읽음
+        """
+        if self.lines is not None:
+            self.lines.release()
+            self.lines = None
+
     def read_sensors(self):
         """
         모든 센서의 상태를 읽어서 반환
         :return: (좌측, 중앙, 우측) 센서 값의 튜플
         """
+        if self.lines is not None:
+            left, middle, right = self.lines.get_values()
+            return (left, middle, right)
+
         left = GPIO.input(self.LINE_PIN_LEFT)
         middle = GPIO.input(self.LINE_PIN_MIDDLE)
         right = GPIO.input(self.LINE_PIN_RIGHT)
@@ -72,6 +115,14 @@ class LineSensorController:
             "sensors": {"left": left, "middle": middle, "right": right},
         }
 
+    def get_line_position_fast(self, out):
+        """
+        라인 위치만 빠르게 판단 (딕셔너리를 만들지 않음)
+        :param out: 결과를 받을 리스트, out[0]에 위치값(-1 ~ 1, 없으면 None)을 씀
+        """
+        left, middle, right = self.read_sensors()
+        out[0] = self.POSITION_BY_PATTERN[(left << 2) | (middle << 1) | right]
+
     def get_simple_position(self):
         """
         간단한 위치 판단 (기존 호환성)
@@ -91,6 +142,7 @@ class LineSensorController:
 
     def cleanup(self):
         """GPIO 설정 초기화"""
+        self.release_lines()
         GPIO.cleanup()
 
 
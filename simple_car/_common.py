@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+초간단 자율 주행차 v3 공통 코드 (고등학생용)
+Shared driving code for ultra_simple_car_v3 / ultra_simple_car_v3_improved
+
+두 v3 프로그램은 로터리 감지 방법만 다르고 나머지는 같습니다.
+하드웨어 준비, 센서 읽기, 모터 동작, 장애물 회피, 주행 루프는 여기 한 곳에만 있고
+각 프로그램은 자기 로터리 감지 함수를 run()에 넘겨서 실행합니다.
+"""
+
+import time
+import random
+import asyncio
+from collections import deque
+from functools import partial
+
+# 하드웨어 가져오기
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from hardware.test_line_sensors import LineSensorController
+    from hardware.test_gear_motors import GearMotorController
+    from hardware.test_ultrasonic_sensor import UltrasonicSensor
+
+    print("✓ 실제 하드웨어 사용")
+    SIMULATION = False
+except ImportError:
+    print("⚠️ 시뮬레이션 모드")
+    SIMULATION = True
+
+# ==================== 설정값 ====================
+# 기본 주행 속도
+FORWARD_SPEED = 80  # 직진 속도
+
+# 좌회전 세부 설정
+LEFT_TURN_RIGHT_MOTOR = 100  # 좌회전시 우측 모터 (높은 속도)
+LEFT_TURN_LEFT_MOTOR = 30  # 좌회전시 좌측 모터 (낮은 속도)
+
+# 우회전 세부 설정
+RIGHT_TURN_LEFT_MOTOR = 100  # 우회전시 좌측 모터 (높은 속도)
+RIGHT_TURN_RIGHT_MOTOR = 30  # 우회전시 우측 모터 (낮은 속도)
+
+# 장애물 회피 설정
+SAFE_DISTANCE = 15  # 장애물 안전 거리 (cm)
+AVOID_TIME = 0.8  # 회피 동작 시간 (초)
+DISTANCE_INTERVAL = 0.05  # 초음파 측정 간격 (초, 백그라운드에서 측정)
+DISTANCE_SAMPLES = 5  # 중앙값을 낼 최근 거리 개수 (튀는 값 하나로는 회피 안 함)
+CONTROL_LOOP_INTERVAL = 0.2  # 주행 판단 주기 (초)
+
+# 로터리 주행 설정 (감지 설정은 각 프로그램 파일에 있음)
+ROTARY_SAFE_SPEED = 40  # 로터리에서 안전 속도
+ROTARY_TURN_SPEED = ROTARY_SAFE_SPEED // 2  # 로터리에서 라인이 좌우에 있을 때
+ROTARY_SEARCH_SPEED = ROTARY_SAFE_SPEED // 3  # 로터리에서 라인이 없을 때
+
+# 라인 상태 번호 (2비트씩 한 정수에 차례로 밀어 넣어 저장)
+LINE_LEFT, LINE_CENTER, LINE_RIGHT, LINE_NONE = range(4)
+LINE_LABELS = ("left", "center", "right", "none")  # 출력할 때만 사용
+
+# 시뮬레이션용 난수 함수와 선택지 (매 틱 import/리스트 생성 없이 사용)
+_rand = random.random
+_choice = random.choice
+_choices = random.choices
+_randint = random.randint
+_ALL_LINES = (LINE_LEFT, LINE_CENTER, LINE_RIGHT, LINE_NONE)
+_NORMAL_CUM_WEIGHTS = (15, 75, 90, 100)  # 가중치 15, 60, 15, 10 (center가 가장 높음)
+
+# 로터리 시뮬레이션 설정 (run()에서 프로그램별 값으로 바뀜)
+_sim_rotary_prob = 0.08  # 로터리 패턴이 나올 확률
+_sim_rotary_lines = (LINE_LEFT, LINE_RIGHT, LINE_NONE, LINE_CENTER)
+
+# 매 틱 로터리 분석 출력 여부 (True로 바꾸면 샘플 분석을 모두 출력)
+DEBUG = False
+
+# 장애물 회피 단계 (회피 중에도 주행 루프가 계속 센서를 확인하도록 단계별로 진행)
+AVOID_IDLE, AVOID_LEFT, AVOID_STRAIGHT, AVOID_RIGHT = range(4)
+avoid_state = AVOID_IDLE
+avoid_deadline = 0.0  # 현재 단계가 끝나는 시각 (time.monotonic 기준)
+
+# 최근 거리 측정값들과 그 중앙값 (cm, 백그라운드 작업이 계속 갱신)
+recent_distances = deque(maxlen=DISTANCE_SAMPLES)
+latest_distance = 999
+
+# 출력 문구 (하드웨어/시뮬레이션은 프로그램 시작할 때 한 번 정해짐)
+if SIMULATION:
+    _MSG_STOP = "시뮬레이션: 정지"
+    _MSG_FORWARD = "시뮬레이션: 직진 (속도: {})"
+    _MSG_LEFT = f"시뮬레이션: 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})"
+    _MSG_RIGHT = f"시뮬레이션: 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})"
+else:
+    _MSG_STOP = "⏹️ 정지"
+    _MSG_FORWARD = "⬆️ 직진 (속도: {})"
+    _MSG_LEFT = f"⬅️ 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})"
+    _MSG_RIGHT = f"➡️ 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})"
+
+
+class Hw:
+    """
+    하드웨어 객체 묶음 (정해진 속성만 쓰도록 __slots__ 사용)
+
+    시뮬레이션이면 set_speeds/stop이 아무것도 안 하는 함수라서
+    주행 함수들이 매번 "모터가 있나?"를 확인하지 않아도 됨
+    """
+
+    __slots__ = ("line", "motor", "us", "set_speeds", "stop")
+
+    def __init__(self):
+        self.line = None  # 라인 센서
+        self.motor = None  # 모터
+        self.us = None  # 초음파 센서
+        self.set_speeds = lambda right, left: None  # (오른쪽 A, 왼쪽 B) 속도 설정
+        self.stop = lambda: None
+
+
+# 하드웨어 객체들 (setup()에서 채움, 주행 함수들은 기본 인자로 받아 지역 변수로 사용)
+hw = Hw()
+
+
+def setup():
+    """하드웨어 준비"""
+    if not SIMULATION:
+        try:
+            hw.line = LineSensorController()
+            hw.motor = GearMotorController()
+            hw.us = UltrasonicSensor()
+            # 모터 메서드는 한 번만 찾아 두고 매 명령마다 재사용
+            hw.set_speeds = hw.motor.set_motor_speeds
+            hw.stop = hw.motor.motor_stop
+            print("✓ 하드웨어 준비 완료")
+            return True
+        except Exception as e:
+            print(f"❌ 하드웨어 오류: {e}")
+            return False
+    else:
+        print("✓ 시뮬레이션 준비 완료")
+        return True
+
+
+def read_line(_hw=hw):
+    """라인 위치 읽기"""
+    if _hw.line:
+        line_info = _hw.line.get_line_position()
+        position = line_info["position"]
+
+        if position is None:
+            return LINE_NONE
+        # -0.3 미만 left(0), -0.3~0.3 center(1), 0.3 초과 right(2)
+        return (position >= -0.3) + (position > 0.3)
+    else:
+        # 시뮬레이션 (로터리 시뮬레이션 포함)
+        # 로터리 시뮬레이션: 가끔 라인이 자주 변하는 패턴 생성
+        if _rand() < _sim_rotary_prob:
+            return _choice(_sim_rotary_lines)
+        else:
+            # 일반 도로: center가 많음
+            return _choices(_ALL_LINES, cum_weights=_NORMAL_CUM_WEIGHTS)[0]
+
+
+def read_distance(_hw=hw):
+    """앞의 거리 읽기"""
+    if _hw.us:
+        distance = _hw.us.measure_distance()
+        return distance if distance else 999
+    else:
+        # 시뮬레이션
+        if _rand() < 0.06:  # 6% 확률로 장애물
+            distance = _randint(5, SAFE_DISTANCE - 1)
+            return distance
+        else:
+            return _randint(SAFE_DISTANCE + 10, 100)
+
+
+def update_distance(distance):
+    """새 거리를 추가하고 최근 측정값들의 중앙값을 latest_distance에 저장"""
+    global latest_distance
+
+    recent_distances.append(distance)
+    # 최대 5개라 정렬해서 가운데 값을 골라도 충분히 빠름
+    latest_distance = sorted(recent_distances)[len(recent_distances) // 2]
+    return latest_distance
+
+
+def _dbg(msg):
+    """
+    DEBUG일 때만 쓰는 분석 출력 (flush 없이 줄 단위 버퍼에 맡김)
+
+    메시지 f-string은 호출 전에 만들어지므로 항상 `if DEBUG:` 안에서 호출
+    (DEBUG가 꺼져 있으면 문자열을 만들지도 않음)
+    """
+    print(msg, flush=False)
+
+
+def _popcount(x):
+    """1인 비트 개수 (Python 3.10 미만에도 동작)"""
+    return bin(x).count("1")
+
+
+def _lanes_nonzero(x, lanes):
+    """lanes 칸 중 0이 아닌 2비트 칸만 아래 비트로 표시"""
+    return (x | (x >> 1)) & lanes
+
+
+def stop(_hw=hw):
+    """정지"""
+    _hw.stop()
+    print(_MSG_STOP)
+
+
+def go_forward(speed=None, _hw=hw):
+    """직진"""
+    speed = speed or FORWARD_SPEED
+    _hw.set_speeds(speed, speed)
+    print(_MSG_FORWARD.format(speed))
+
+
+def turn_left(_hw=hw):
+    """좌회전 (개별 속도 설정)"""
+    # 오른쪽: 높은 속도, 왼쪽: 낮은 속도 후진
+    _hw.set_speeds(LEFT_TURN_RIGHT_MOTOR, -LEFT_TURN_LEFT_MOTOR)
+    print(_MSG_LEFT)
+
+
+def turn_right(_hw=hw):
+    """우회전 (개별 속도 설정)"""
+    # 오른쪽: 낮은 속도 후진, 왼쪽: 높은 속도
+    _hw.set_speeds(-RIGHT_TURN_RIGHT_MOTOR, RIGHT_TURN_LEFT_MOTOR)
+    print(_MSG_RIGHT)
+
+
+# 라인 코드(left, center, right, none) 순서의 동작 테이블
+# 일반 모드: 정상 속도로 라인 추적, 라인이 없으면 왼쪽으로 찾기
+ACTIONS_NORMAL = (turn_right, go_forward, turn_left, turn_left)
+# 로터리 모드: 안전하게 천천히, 좌우는 부드럽게, 라인이 없어도 천천히 직진
+ACTIONS_ROTARY = (
+    partial(go_forward, ROTARY_TURN_SPEED),
+    partial(go_forward, ROTARY_SAFE_SPEED),
+    partial(go_forward, ROTARY_TURN_SPEED),
+    partial(go_forward, ROTARY_SEARCH_SPEED),
+)
+
+
+async def distance_task():
+    """
+    초음파 거리를 백그라운드에서 계속 측정해서 중앙값을 latest_distance에 저장
+    (에코를 기다리는 동안 주행 루프가 멈추지 않도록 별도 스레드에서 측정)
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        update_distance(await loop.run_in_executor(None, read_distance))
+        await asyncio.sleep(DISTANCE_INTERVAL)
+
+
+# 회피 단계별 안내 문구와 동작 (AVOID_LEFT, AVOID_STRAIGHT, AVOID_RIGHT 순서)
+_AVOID_STEPS = (
+    None,
+    ("  1. 좌회전으로 피하기", turn_left),
+    ("  2. 직진으로 지나가기", go_forward),
+    ("  3. 우회전으로 복귀", turn_right),
+)
+
+
+def _enter_avoid_state(state, now):
+    """회피 단계를 바꾸고 그 단계의 동작을 한 번 실행"""
+    global avoid_state, avoid_deadline
+
+    avoid_state = state
+    if state == AVOID_IDLE:
+        print("✅ 장애물 회피 완료!")
+        return
+    message, action = _AVOID_STEPS[state]
+    print(message)
+    action()
+    avoid_deadline = now + AVOID_TIME
+
+
+def avoid_obstacle(now):
+    """장애물 피하기 시작 (좌회전 → 직진 → 우회전, 다음 단계는 smart_drive가 진행)"""
+    print("🚨 장애물 회피 시작!")
+    _enter_avoid_state(AVOID_LEFT, now)
+
+
+def smart_drive(check_rotary_fn):
+    """스마트 주행 (모든 기능 통합, 로터리 감지는 check_rotary_fn 사용)"""
+    now = time.monotonic()
+    # 백그라운드에서 측정한 최근 거리의 중앙값 사용
+    distance = latest_distance
+
+    # 회피 중: 시간이 되면 다음 단계로, 더 가까운 장애물이면 처음부터 다시 회피
+    if avoid_state != AVOID_IDLE:
+        if distance < SAFE_DISTANCE / 2 and avoid_state != AVOID_LEFT:
+            print(f"🚨 회피 중 장애물 재감지: {distance}cm")
+            avoid_obstacle(now)
+        elif now >= avoid_deadline:
+            _enter_avoid_state((avoid_state + 1) % 4, now)
+        return
+
+    # 1단계: 장애물 확인 (최우선)
+    if distance < SAFE_DISTANCE:
+        print(f"🚨 장애물 감지: {distance}cm")
+        avoid_obstacle(now)
+        return
+
+    # 2단계: 라인 읽기
+    line_position = read_line()
+
+    # 3단계: 로터리 감지 (프로그램마다 다른 알고리즘)
+    is_rotary = check_rotary_fn(line_position)
+
+    # 4단계: 주행 모드 결정 (라인 코드로 동작 테이블 조회)
+    if is_rotary and DEBUG:
+        _dbg(f"🌀 로터리 안전 주행: {LINE_LABELS[line_position]}")
+    (ACTIONS_ROTARY if is_rotary else ACTIONS_NORMAL)[line_position]()
+
+
+def show_settings(title, rotary_title, rotary_lines):
+    """현재 설정 표시 (로터리 감지 부분은 프로그램마다 다름)"""
+    print("\n" + "=" * 50)
+    print(title)
+    print("=" * 50)
+    print("📈 기본 속도:")
+    print(f"  직진 속도: {FORWARD_SPEED}")
+    print()
+    print("🔄 회전 속도 (개별 설정):")
+    print(
+        f"  좌회전 - 우측모터: {LEFT_TURN_RIGHT_MOTOR}, 좌측모터: {LEFT_TURN_LEFT_MOTOR}"
+    )
+    print(
+        f"  우회전 - 우측모터: {RIGHT_TURN_RIGHT_MOTOR}, 좌측모터: {RIGHT_TURN_LEFT_MOTOR}"
+    )
+    print()
+    print("🛡️ 장애물 회피:")
+    print(f"  안전 거리: {SAFE_DISTANCE}cm")
+    print(f"  회피 시간: {AVOID_TIME}초")
+    print()
+    print(rotary_title)
+    for line in rotary_lines:
+        print(f"  {line}")
+    print("=" * 50)
+
+
+def cleanup():
+    """정리"""
+    try:
+        stop()
+        if hw.line:
+            hw.line.cleanup()
+        if hw.motor:
+            hw.motor.cleanup()
+        if hw.us:
+            hw.us.cleanup()
+        print("✓ 정리 완료")
+    except:
+        pass
+
+
+async def drive_loop(check_rotary_fn):
+    """초음파 측정 작업과 주행 루프를 함께 실행"""
+    update_distance(read_distance())  # 첫 거리는 바로 측정
+    sensor = asyncio.create_task(distance_task())
+    next_tick = time.monotonic()
+    try:
+        while True:
+            # 측정 작업이 오류로 끝났으면 그 오류를 다시 일으켜서 차를 멈춤
+            # (멈춘 latest_distance로 계속 달리지 않도록)
+            if sensor.done():
+                sensor.result()
+            smart_drive(check_rotary_fn)
+
+            # 작업 시간과 상관없이 CONTROL_LOOP_INTERVAL마다 주행 판단
+            next_tick += CONTROL_LOOP_INTERVAL
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_tick = time.monotonic()  # 늦어졌으면 지금부터 다시 시작
+    finally:
+        sensor.cancel()
+
+
+def run(
+    check_rotary_fn,
+    show_info_fn,
+    start_message="🚀 스마트 자율 주행 시작!",
+    sim_rotary_prob=None,
+    sim_rotary_lines=None,
+):
+    """
+    v3 프로그램 공통 실행 함수
+
+    check_rotary_fn: 라인 상태를 받아 로터리 모드 여부를 돌려주는 함수
+    show_info_fn: 시작할 때 설명과 설정을 출력하는 함수
+    sim_rotary_prob, sim_rotary_lines: 시뮬레이션 로터리 패턴 (없으면 기본값)
+    """
+    global _sim_rotary_prob, _sim_rotary_lines
+
+    if sim_rotary_prob is not None:
+        _sim_rotary_prob = sim_rotary_prob
+    if sim_rotary_lines is not None:
+        _sim_rotary_lines = sim_rotary_lines
+
+    show_info_fn()
+
+    if not setup():
+        print("❌ 하드웨어 준비 실패")
+        return
+
+    print(f"\n{start_message}")
+    print("Ctrl+C로 언제든지 중단할 수 있습니다")
+    print("=" * 50)
+
+    try:
+        asyncio.run(drive_loop(check_rotary_fn))
+
+    except KeyboardInterrupt:
+        print("\n\n⌨️ 사용자가 중단했습니다")
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+    finally:
+        cleanup()
+        print("👋 프로그램 종료")
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+초간단 자율 주행차 v2 공통 주행 코드
+- ultra_simple_car_v2.py / ultra_simple_car_v2_easy.py 가 함께 사용
+- 설정값, 센서 읽기, 모터 동작, 로터리 감지, 단계별 주행 함수
+"""
+
+import time
+import random
+import sys
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# 하드웨어 가져오기
+import os
+
+# 저장소 루트 (hardware 패키지 위치) - 여러 번 import 되어도 한 번만 추가
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+try:
+    from hardware.test_line_sensors import LineSensorController
+    from hardware.test_gear_motors import GearMotorController
+    from hardware.test_ultrasonic_sensor import UltrasonicSensor
+
+    print("✓ 실제 하드웨어 사용")
+    SIMULATION = False
+except ImportError:
+    print("⚠️ 시뮬레이션 모드")
+    SIMULATION = True
+
+# ==================== 설정값 (단계별 학습용) ====================
+# 기본 주행 속도
+FORWARD_SPEED = 80  # 직진 속도
+
+# 좌회전 세부 설정
+LEFT_TURN_RIGHT_MOTOR = 100  # 좌회전시 우측 모터 (높은 속도)
+LEFT_TURN_LEFT_MOTOR = 30  # 좌회전시 좌측 모터 (낮은 속도)
+
+# 우회전 세부 설정
+RIGHT_TURN_LEFT_MOTOR = 100  # 우회전시 좌측 모터 (높은 속도)
+RIGHT_TURN_RIGHT_MOTOR = 30  # 우회전시 우측 모터 (낮은 속도)
+
+# 장애물 회피 설정
+SAFE_DISTANCE = 15  # 장애물 안전 거리 (cm)
+AVOID_TIME = 0.8  # 회피 동작 시간 (초)
+
+# 로터리 감지 설정 (새로운 기능!)
+# 로터리 감지 시간 (초): 이 시간 안의 라인 변화를 세고, 감지 후 이만큼 안전 주행
+ROTARY_DETECTION_TIME = 2.0
+ROTARY_SAFE_SPEED = 40  # 로터리에서 안전 속도
+ROTARY_LINE_CHANGE_THRESHOLD = 5  # 라인 변화 임계값 (횟수)
+_ROTARY_HALF = ROTARY_SAFE_SPEED // 2  # 라인이 옆으로 벗어났을 때 (더 천천히)
+_ROTARY_THIRD = ROTARY_SAFE_SPEED // 3  # 라인을 놓쳤을 때 (매우 천천히)
+_DET_NS = int(ROTARY_DETECTION_TIME * 1_000_000_000)  # 로터리 감지 시간 (나노초)
+
+# 라인 위치 번호 (문자열 대신 정수로 비교하고 표에서 바로 찾기)
+LINE_CENTER, LINE_LEFT, LINE_RIGHT, LINE_NONE = range(4)
+LINE_LABELS = ("center", "left", "right", "none")  # 출력할 때만 사용
+
+# 시뮬레이션용 난수 함수와 선택지 (매번 찾거나 만들지 않도록 미리 준비)
+_RAND = random.random
+_RR = random.randrange
+_RANDINT = random.randint
+_ROTARY_CHOICES = (
+    LINE_LEFT,
+    LINE_RIGHT,
+    LINE_CENTER,
+    LINE_NONE,
+    LINE_LEFT,
+    LINE_RIGHT,
+)
+_NORMAL_CHOICES = (LINE_LEFT, LINE_CENTER, LINE_RIGHT, LINE_NONE)
+
+# 시뮬레이션 기록: setup()에서 numpy로 한 번에 만들어 두고 순서대로 꺼내 씀
+SIM_TRACE_LEN = 10000
+SIM_SEED = None  # 정수로 정하면 매번 같은 시뮬레이션이 나옴 (테스트용)
+# 위의 random 방식과 같은 확률 (5% 로터리 선택지 + 95% 일반 선택지)
+_SIM_LINE_PROBS = (
+    0.05 / 6 + 0.95 / 4,  # center
+    0.05 * 2 / 6 + 0.95 / 4,  # left
+    0.05 * 2 / 6 + 0.95 / 4,  # right
+    0.05 / 6 + 0.95 / 4,  # none
+)
+_line_trace = None
+_dist_trace = None
+_line_idx = -1
+_dist_idx = -1
+
+# 주행 중 매 틱 출력 여부 (True로 바꾸면 모터 명령/라인 변화를 모두 출력)
+VERBOSE = False
+
+# 하드웨어 객체들
+line_sensor = None
+motor = None
+ultrasonic = None
+
+# 두 모터 속도 설정 함수 (setup에서 motor.set_motor_speeds로 연결)
+_set = None
+
+# 마지막으로 보낸 모터 명령 (오른쪽, 왼쪽) - 같은 명령은 다시 보내지 않음
+_last_cmd = (None, None)
+
+# setup()이 성공해서 정리할 것이 있는지 (cleanup을 두 번 해도 안전하도록)
+_INITED = False
+
+# 장애물 회피 진행 상태 (회피 동작은 타이머로 예약해서 실행)
+_avoiding = False
+_avoid_timers = []
+# 타이머 스레드와 주행/정리 코드가 함께 쓰는 회피 상태를 지키는 잠금
+# (RLock: avoid_obstacle, cleanup 안에서 cancel_avoid를 다시 부르므로)
+_avoid_lock = threading.RLock()
+_avoid_gen = 0  # 회피를 시작/취소할 때마다 1 증가 (이미 출발한 예전 타이머 무시용)
+
+
+@dataclass
+class RotaryState:
+    """로터리 감지용 상태 묶음"""
+
+    # 최근 라인 변화 시각들 (가장 오래된 것은 자동으로 밀려남)
+    transitions: deque = field(
+        default_factory=lambda: deque(maxlen=ROTARY_LINE_CHANGE_THRESHOLD)
+    )
+    last_pos: int = LINE_CENTER  # 마지막 라인 위치
+    mode: bool = False  # 로터리 모드 여부
+    start_ns: int = 0  # 로터리 모드 시작 시각 (monotonic 나노초)
+
+
+# 로터리 감지 상태 (check_rotary에 인자로 넘겨서 사용)
+_RSTATE = RotaryState()
+
+
+def setup():
+    """하드웨어 준비"""
+    global line_sensor, motor, ultrasonic, _set, _last_cmd, _INITED
+
+    if _INITED:
+        cleanup()  # 이전 단계의 하드웨어를 먼저 정리 (덮어쓰면 정리되지 않음)
+
+    _last_cmd = (None, None)
+
+    if not SIMULATION:
+        try:
+            line_sensor = LineSensorController()
+            motor = GearMotorController()
+            ultrasonic = UltrasonicSensor()
+            _set = motor.set_motor_speeds
+            _INITED = True
+            print("✓ 하드웨어 준비 완료")
+            return True
+        except Exception as e:
+            print(f"❌ 하드웨어 오류: {e}")
+            cleanup()  # 중간까지 만든 컨트롤러(모터 PWM, GPIO 핀) 놓아주기
+            return False
+    else:
+        make_sim_traces()
+        _INITED = True
+        print("✓ 시뮬레이션 준비 완료")
+        return True
+
+
+def make_sim_traces():
+    """시뮬레이션용 라인/거리 기록을 numpy로 한 번에 만들기"""
+    global _line_trace, _dist_trace, _line_idx, _dist_idx
+
+    try:
+        import numpy as np
+    except ImportError:
+        return  # numpy가 없으면 매번 random으로 뽑기
+
+    rng = np.random.default_rng(SIM_SEED)
+    lines = rng.choice(4, size=SIM_TRACE_LEN, p=_SIM_LINE_PROBS)
+    distances = np.where(
+        rng.random(SIM_TRACE_LEN) < 0.08,  # 8% 확률로 장애물
+        rng.integers(5, SAFE_DISTANCE, SIM_TRACE_LEN),
+        rng.integers(SAFE_DISTANCE + 10, 101, SIM_TRACE_LEN),
+    )
+
+    # 주행 중에는 numpy 대신 파이썬 리스트로 빠르게 꺼내기
+    _line_trace = lines.tolist()  # 0~3 = LINE_CENTER~LINE_NONE
+    _dist_trace = distances.tolist()
+    _line_idx = -1
+    _dist_idx = -1
+
+
+def read_line():
+    """라인 위치 읽기"""
+    global _line_idx
+
+    if line_sensor:
+        line_info = line_sensor.get_line_position()
+        position = line_info["position"]
+
+        if position is None:
+            return LINE_NONE
+        elif position < -0.3:
+            return LINE_LEFT
+        elif position > 0.3:
+            return LINE_RIGHT
+        else:
+            return LINE_CENTER
+    elif _line_trace is not None:
+        # 시뮬레이션: 미리 만든 기록에서 다음 값 꺼내기
+        _line_idx = (_line_idx + 1) % SIM_TRACE_LEN
+        return _line_trace[_line_idx]
+    else:
+        # 시뮬레이션 (numpy가 없을 때, 로터리 시뮬레이션 포함)
+        # 로터리 시뮬레이션: 가끔 빠른 라인 변화 생성
+        if _RAND() < 0.05:  # 5% 확률로 로터리 시뮬레이션
+            return _ROTARY_CHOICES[_RR(6)]
+        else:
+            return _NORMAL_CHOICES[_RR(4)]
+
+
+def read_distance():
+    """앞의 거리 읽기"""
+    global _dist_idx
+
+    if ultrasonic:
+        return ultrasonic.measure_distance() or 999  # 측정 실패(None/0)는 999
+    elif _dist_trace is not None:
+        # 시뮬레이션: 미리 만든 기록에서 다음 값 꺼내기
+        _dist_idx = (_dist_idx + 1) % SIM_TRACE_LEN
+        distance = _dist_trace[_dist_idx]
+        if distance < SAFE_DISTANCE:
+            print(f"🚨 시뮬레이션 장애물: {distance}cm")
+        return distance
+    else:
+        # 시뮬레이션
+        if _RAND() < 0.08:  # 8% 확률로 장애물
+            distance = _RANDINT(5, SAFE_DISTANCE - 1)
+            print(f"🚨 시뮬레이션 장애물: {distance}cm")
+            return distance
+        else:
+            distance = _RANDINT(SAFE_DISTANCE + 10, 100)
+            return distance
+
+
+def check_rotary(state, current_line):
+    """로터리(회전교차로) 감지 함수 - 새로운 기능!"""
+    # 시계가 바뀌어도(NTP 등) 흔들리지 않는 monotonic 시간 사용
+    now = time.monotonic_ns()
+    transitions = state.transitions
+
+    # 라인 위치가 변경되었는지 확인 (변화 시각 기록)
+    if current_line != state.last_pos:
+        transitions.append(now)
+        state.last_pos = current_line
+        if VERBOSE:
+            print(f"  📊 라인 변화 감지: 최근 {len(transitions)}회")
+
+    # 로터리 감지 조건: 최근 ROTARY_DETECTION_TIME 안에 임계값만큼 라인 변화
+    if (
+        not state.mode
+        and len(transitions) == ROTARY_LINE_CHANGE_THRESHOLD
+        and now - transitions[0] < _DET_NS
+    ):
+        state.mode = True
+        state.start_ns = now
+        transitions.clear()  # 기록 리셋
+        print("🌀 로터리 감지! 안전 모드로 전환")
+        return True
+
+    # 로터리 모드에서 일정 시간 경과 시 해제
+    if state.mode and (now - state.start_ns) > _DET_NS:
+        state.mode = False
+        print("✅ 로터리 통과 완료! 정상 모드로 복귀")
+        return False
+
+    return state.mode
+
+
+# 회전 메시지 (설정값이 바뀌지 않으므로 미리 만들어 둠)
+_MSG_LEFT = f"⬅️ 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})\n"
+_MSG_LEFT_SIM = (
+    f"시뮬레이션: 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})\n"
+)
+_MSG_RIGHT = f"➡️ 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})\n"
+_MSG_RIGHT_SIM = (
+    f"시뮬레이션: 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})\n"
+)
+
+
+@lru_cache(maxsize=8)
+def _forward_msg(speed, sim):
+    """직진 메시지 (속도가 몇 가지뿐이라 한 번 만든 문자열을 재사용)"""
+    if sim:
+        return f"시뮬레이션: 직진 (속도: {speed})\n"
+    return f"⬆️ 직진 (속도: {speed})\n"
+
+
+def stop():
+    """정지"""
+    global _last_cmd
+    _last_cmd = (0, 0)
+    if motor:
+        motor.motor_stop()
+        print("⏹️ 정지")
+    else:
+        print("시뮬레이션: 정지")
+
+
+def go_forward(speed=None):
+    """직진"""
+    global _last_cmd
+    speed = speed or FORWARD_SPEED
+    cmd = (speed, speed)
+    if cmd == _last_cmd:
+        return  # 이미 같은 속도로 직진 중 - 모터 쓰기와 출력 생략
+    _last_cmd = cmd
+    if motor:
+        _set(speed, speed)  # (오른쪽, 왼쪽)
+        if VERBOSE:
+            sys.stdout.write(_forward_msg(speed, False))
+    elif VERBOSE:
+        sys.stdout.write(_forward_msg(speed, True))
+
+
+def turn_left():
+    """좌회전 (개별 속도 설정)"""
+    global _last_cmd
+    cmd = (LEFT_TURN_RIGHT_MOTOR, -LEFT_TURN_LEFT_MOTOR)
+    if cmd == _last_cmd:
+        return  # 이미 좌회전 중
+    _last_cmd = cmd
+    if motor:
+        _set(*cmd)  # 오른쪽: 높은 속도, 왼쪽: 낮은 속도 후진
+        if VERBOSE:
+            sys.stdout.write(_MSG_LEFT)
+    elif VERBOSE:
+        sys.stdout.write(_MSG_LEFT_SIM)
+
+
+def turn_right():
+    """우회전 (개별 속도 설정)"""
+    global _last_cmd
+    cmd = (-RIGHT_TURN_RIGHT_MOTOR, RIGHT_TURN_LEFT_MOTOR)
+    if cmd == _last_cmd:
+        return  # 이미 우회전 중
+    _last_cmd = cmd
+    if motor:
+        _set(*cmd)  # 오른쪽: 낮은 속도 후진, 왼쪽: 높은 속도
+        if VERBOSE:
+            sys.stdout.write(_MSG_RIGHT)
+    elif VERBOSE:
+        sys.stdout.write(_MSG_RIGHT_SIM)
+
+
+def avoid_obstacle(distance):
+    """
+    장애물 피하기 (좌회전 → 직진 → 우회전)
+    2, 3단계는 타이머로 예약하고 바로 돌아오므로 회피 중에도 주행 루프가
+    계속 거리를 재고 'q' 키를 확인할 수 있음
+    """
+    global _avoiding, _avoid_timers, _avoid_gen
+
+    with _avoid_lock:
+        if _avoiding:
+            if distance >= SAFE_DISTANCE / 2:
+                return  # 예약된 회피 동작 계속 진행 (센서 값이 조금 흔들려도 무시)
+            # 회피 중 아주 가까운 새 장애물: 예약 취소 후 처음부터 다시
+            # (v3의 smart_drive와 같은 기준)
+            print(f"  ⚠️ 회피 중 장애물 재감지({distance}cm)! 회피 다시 시작")
+            cancel_avoid()
+        else:
+            print("🚨 장애물 회피 시작!")
+
+        _avoiding = True
+        _avoid_gen += 1
+        gen = _avoid_gen
+
+        # 1단계: 좌회전 (바로 실행)
+        print("  1. 좌회전으로 피하기")
+        turn_left()
+
+        # 2, 3단계와 완료는 AVOID_TIME 간격으로 예약
+        _avoid_timers = [
+            threading.Timer(AVOID_TIME, _avoid_step, (gen, _avoid_pass)),
+            threading.Timer(2 * AVOID_TIME, _avoid_step, (gen, _avoid_return)),
+            threading.Timer(3 * AVOID_TIME, _avoid_step, (gen, _avoid_done)),
+        ]
+        for timer in _avoid_timers:
+            timer.daemon = True
+            timer.start()
+
+
+def _avoid_step(gen, step):
+    """
+    타이머 스레드에서 회피 단계 하나 실행
+    이미 취소됐거나(gen이 다름) 정리가 끝났으면 모터를 건드리지 않음
+    """
+    with _avoid_lock:
+        if _INITED and _avoiding and gen == _avoid_gen:
+            step()
+
+
+def _avoid_pass():
+    """2단계: 직진으로 지나가기"""
+    print("  2. 직진으로 지나가기")
+    go_forward()
+
+
+def _avoid_return():
+    """3단계: 우회전으로 원래 방향"""
+    print("  3. 우회전으로 복귀")
+    turn_right()
+
+
+def _avoid_done():
+    """회피 완료 - 주행 루프가 다시 라인을 따라감"""
+    global _avoiding
+    _avoiding = False
+    print("✅ 장애물 회피 완료!")
+
+
+def cancel_avoid():
+    """예약된 회피 동작 모두 취소 (이미 실행을 시작한 타이머도 gen으로 막음)"""
+    global _avoiding, _avoid_gen
+    with _avoid_lock:
+        for timer in _avoid_timers:
+            timer.cancel()
+        _avoiding = False
+        _avoid_gen += 1
+
+
+# 라인 위치별 기본 주행 동작 (if-elif 대신 라인 번호로 바로 찾기)
+_BASIC_ACTIONS = (
+    go_forward,  # LINE_CENTER
+    turn_right,  # LINE_LEFT
+    turn_left,  # LINE_RIGHT
+    turn_left,  # LINE_NONE - 라인 찾기
+)
+
+# 로터리 모드에서 라인 위치별 속도 (CENTER, LEFT, RIGHT, NONE 순서)
+_ROTARY_SPEEDS = (ROTARY_SAFE_SPEED, _ROTARY_HALF, _ROTARY_HALF, _ROTARY_THIRD)
+
+
+def drive_basic():
+    """기본 주행 모드 (Step 1)"""
+    _BASIC_ACTIONS[read_line()]()
+
+
+def drive_with_obstacle():
+    """장애물 회피 포함 주행 (Step 2)"""
+    _safe = SAFE_DISTANCE
+
+    # 1단계: 장애물 확인 (회피 중이면 라인 추적은 쉬고 거리만 감시)
+    distance = read_distance()
+    if _avoiding or distance < _safe:
+        avoid_obstacle(distance)
+        return
+
+    # 2단계: 기본 라인 추적
+    drive_basic()
+
+
+def drive_with_rotary():
+    """로터리 감지 포함 주행 (Step 3 - 최고급)"""
+    _safe = SAFE_DISTANCE
+
+    # 1단계: 장애물 확인 (회피 중이면 라인 추적은 쉬고 거리만 감시)
+    distance = read_distance()
+    if _avoiding or distance < _safe:
+        avoid_obstacle(distance)
+        return
+
+    # 2단계: 라인 읽기
+    line_position = read_line()
+
+    # 3단계: 로터리 감지
+    is_rotary = check_rotary(_RSTATE, line_position)
+
+    # 4단계: 주행 모드 결정
+    if is_rotary:
+        # 로터리 모드: 안전하게 천천히
+        if VERBOSE:
+            print(f"🌀 로터리 안전 주행: {LINE_LABELS[line_position]}")
+        go_forward(_ROTARY_SPEEDS[line_position])
+    else:
+        # 일반 모드: 정상 속도
+        drive_basic()
+
+
+def cleanup():
+    """
+    정리 (setup 전이거나 이미 정리했으면 아무것도 하지 않음)
+    setup이 중간에 실패해서 일부 컨트롤러만 만들어졌어도 그것들은 정리함
+    """
+    global line_sensor, motor, ultrasonic, _set, _INITED
+
+    # 잠금을 잡고 정리 (타이머 스레드가 정리 도중이나 뒤에 모터를 움직이지 않도록)
+    with _avoid_lock:
+        if not (_INITED or line_sensor or motor or ultrasonic):
+            return
+
+        cancel_avoid()  # 정리 뒤에 예약된 모터 동작이 실행되지 않도록
+        try:
+            stop()
+            if line_sensor:
+                line_sensor.cleanup()
+            if motor:
+                motor.cleanup()
+            if ultrasonic:
+                ultrasonic.cleanup()
+            print("✓ 정리 완료")
+        except (RuntimeError, OSError) as e:
+            print(f"⚠️ 정리 중 오류: {e}")
+        finally:
+            line_sensor = motor = ultrasonic = None
+            _set = None
+            _INITED = False
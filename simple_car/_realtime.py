@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+실시간 스케줄링 도우미 (고등학생용)
+Real-time Scheduling Helpers for the Simple Car Modules
+
+제어 루프를 한 CPU 코어에 고정하고 SCHED_FIFO 우선순위로 올렸다가,
+끝나면 원래대로 되돌리는 함수들입니다. (root 권한 또는 CAP_SYS_NICE 필요)
+- ultra_simple_car.py 와 check/ 폴더의 프로그램들이 함께 사용
+"""
+
+import ctypes
+import os
+
+RT_PRIORITY = 80   # SCHED_FIFO 우선순위 (1~99)
+RT_CPU = 3         # 제어 루프만 돌릴 CPU 코어 번호
+MCL_CURRENT = 1    # mlockall: 지금 있는 메모리 페이지 고정
+MCL_FUTURE = 2     # mlockall: 앞으로 생길 메모리 페이지도 고정
+
+
+def get_scheduling():
+    """
+    지금 스레드의 스케줄링 설정 (정책, 우선순위, 코어 목록)을 반환합니다
+    리눅스가 아니라서 읽을 수 없으면 None을 반환합니다
+    """
+    try:
+        return (
+            os.sched_getscheduler(0),
+            os.sched_getparam(0),
+            os.sched_getaffinity(0),
+        )
+    except (AttributeError, OSError):
+        return None
+
+
+def restore_scheduling(saved):
+    """
+    get_scheduling()으로 저장해 둔 설정으로 지금 스레드를 되돌립니다
+    (우선순위를 낮추고 코어를 넓히는 것은 권한이 없어도 됩니다)
+    """
+    if saved is None:
+        return
+    policy, param, cpus = saved
+    try:
+        os.sched_setscheduler(0, policy, param)
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as e:
+        print(f"⚠️ 스케줄링 설정 복원 실패: {e}")
+
+
+def lock_memory():
+    """
+    mlockall로 메모리를 고정합니다 (페이지 폴트로 멈추지 않게)
+    CAP_IPC_LOCK 권한이 없으면 경고만 출력합니다
+    """
+    try:
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            print(f"⚠️ 메모리 고정 실패: {os.strerror(ctypes.get_errno())}")
+            return False
+        print("✓ 메모리 고정 (mlockall)")
+        return True
+    except OSError as e:
+        print(f"⚠️ 메모리 고정 사용 불가: {e}")
+        return False
+
+
+def enable_realtime():
+    """
+    지금 스레드를 RT_CPU 코어에 고정하고 SCHED_FIFO 우선순위로 올립니다
+    권한이 없으면 경고만 출력하고 그대로 진행합니다
+
+    반환값: 바꾸기 전 설정 (끝나면 restore_scheduling에 넘겨서 되돌리기)
+    이 뒤에 만드는 스레드도 같은 설정을 물려받으니 주의하세요.
+    """
+    saved = get_scheduling()
+    try:
+        os.sched_setaffinity(0, {RT_CPU})
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+        print(f"✓ 실시간 모드 (코어 {RT_CPU}, 우선순위 {RT_PRIORITY})")
+        return saved
+    except PermissionError:
+        print("⚠️ 실시간 모드 권한 없음 - sudo로 실행하거나 CAP_SYS_NICE를 주세요")
+    except (AttributeError, OSError) as e:
+        print(f"⚠️ 실시간 모드 사용 불가: {e}")
+    print(f"   (완전히 분리하려면 /boot/cmdline.txt 에 isolcpus={RT_CPU} 추가)")
+    restore_scheduling(saved)  # 코어만 바뀌고 실패했을 수도 있음
+    return saved
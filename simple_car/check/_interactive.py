@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+대화형 테스트/설명 모음 (고등학생용)
+Interactive Tests and Explanations for the Simple Car Modules
+
+각 모듈을 직접 실행할 때만 필요한 테스트, 설명, 메뉴 함수들입니다.
+주행 코드에서 모듈을 import 할 때는 이 파일을 읽지 않아서 더 빨리 시작합니다.
+"""
+
+import time
+
+from simple_sensors import (
+    read_line,
+    read_distance,
+    is_obstacle_close,
+    setup_sensors,
+    cleanup_sensors,
+    LinePos,
+    LINE_LABELS,
+)
+from simple_motors import (
+    go_forward,
+    go_backward,
+    turn_left,
+    turn_right,
+    turn_left_gentle,
+    turn_right_gentle,
+    stop,
+    setup_motors,
+    cleanup_motors,
+    SPEED_SLOW,
+    SPEED_NORMAL,
+    SPEED_FAST,
+    MOTOR_PWM_FREQ,
+)
+from simple_line_follow import start_line_following
+from simple_obstacle_avoid import (
+    check_obstacle,
+    start_obstacle_avoidance,
+    SAFE_DISTANCE,
+    DANGER_DISTANCE,
+    AVOID_TIME,
+)
+
+
+# ============ 센서 (simple_sensors.py) ============
+
+
+def test_sensors():
+    """센서들을 테스트합니다"""
+    print("\n🧪 센서 테스트")
+    
+    if not setup_sensors():
+        print("❌ 센서 준비 실패")
+        return
+    
+    print("\n5초 동안 센서 읽기...")
+    for i in range(10):
+        line_result = read_line()
+        distance = read_distance()
+        obstacle = is_obstacle_close()
+        
+        print(f"{i+1}. 라인: {LINE_LABELS[line_result]:6} | 거리: {distance:3.0f}cm | 장애물: {'예' if obstacle else '아니오'}")
+        time.sleep(0.5)
+    
+    cleanup_sensors()
+    print("테스트 완료!")
+
+
+def sensors_main():
+    """simple_sensors.py 를 직접 실행했을 때의 메뉴"""
+    test_sensors()
+
+
+# ============ 모터 (simple_motors.py) ============
+
+
+def test_motors():
+    """모터들을 테스트합니다"""
+    print("\n🚗 모터 테스트")
+
+    if not setup_motors():
+        print("❌ 모터 준비 실패")
+        return
+
+    print("\n다양한 움직임 테스트...")
+
+    # 직진
+    print("1. 직진")
+    go_forward()
+    time.sleep(1)
+
+    # 좌회전
+    print("2. 좌회전")
+    turn_left()
+    time.sleep(1)
+
+    # 우회전
+    print("3. 우회전")
+    turn_right()
+    time.sleep(1)
+
+    # 부드러운 좌회전
+    print("4. 부드러운 좌회전")
+    turn_left_gentle()
+    time.sleep(1)
+
+    # 부드러운 우회전
+    print("5. 부드러운 우회전")
+    turn_right_gentle()
+    time.sleep(1)
+
+    # 후진
+    print("6. 후진")
+    go_backward()
+    time.sleep(1)
+
+    # 정지
+    print("7. 정지")
+    stop()
+
+    cleanup_motors()
+    print("테스트 완료!")
+
+
+def show_speed_settings():
+    """현재 속도 설정을 보여줍니다"""
+    print("\n⚙️ 현재 속도 설정:")
+    print(f"  느린 속도: {SPEED_SLOW}")
+    print(f"  보통 속도: {SPEED_NORMAL}")
+    print(f"  빠른 속도: {SPEED_FAST}")
+    print(f"  PWM 주파수: {MOTOR_PWM_FREQ}Hz")
+    print("\n💡 속도를 바꾸려면:")
+    print("  파일 상단의 SPEED_SLOW, SPEED_NORMAL, SPEED_FAST 값을 수정하세요!")
+
+
+def motors_main():
+    """simple_motors.py 를 직접 실행했을 때의 메뉴"""
+    show_speed_settings()
+    test_motors()
+
+
+# ============ 라인 추적 (simple_line_follow.py) ============
+
+
+def test_line_following():
+    """라인 추적 기능을 테스트합니다"""
+    print("\n🧪 라인 추적 테스트")
+    
+    # 센서와 모터 준비
+    if not setup_sensors():
+        print("❌ 센서 준비 실패")
+        return
+        
+    if not setup_motors():
+        print("❌ 모터 준비 실패")
+        return
+    
+    print("\n5초 동안 라인 상태에 따른 동작 테스트...")
+    
+    for i in range(25):  # 5초 = 25번 × 0.2초
+        line_position = read_line()
+        print(f"라인 위치: {LINE_LABELS[line_position]:6} → ", end="")
+        
+        # 동작 결정 (실제로는 움직이지 않고 출력만)
+        if line_position == LinePos.CENTER:
+            print("직진")
+        elif line_position == LinePos.LEFT:
+            print("오른쪽으로 회전")
+        elif line_position == LinePos.RIGHT:
+            print("왼쪽으로 회전")
+        else:
+            print("라인 찾기")
+        
+        time.sleep(0.2)
+    
+    cleanup_sensors()
+    cleanup_motors()
+    print("테스트 완료!")
+
+
+def explain_line_following():
+    """라인 추적 원리를 설명합니다"""
+    print("\n📚 라인 추적 원리:")
+    print("="*50)
+    print("1. 센서가 검은 선의 위치를 확인합니다")
+    print("   - 'center': 선이 가운데 → 직진")
+    print("   - 'left':   선이 왼쪽   → 오른쪽으로 회전")
+    print("   - 'right':  선이 오른쪽 → 왼쪽으로 회전")
+    print("   - 'none':   선이 없음   → 찾기 위해 회전")
+    print()
+    print("2. 기본 모드 vs 부드러운 모드:")
+    print("   - 기본: 빠르게 반응 (급회전)")
+    print("   - 부드러운: 천천히 반응 (완만한 회전)")
+    print()
+    print("3. 사용법:")
+    print("   start_line_following(smooth_mode=True)  # 부드러운 모드")
+    print("   start_line_following(smooth_mode=False) # 기본 모드")
+
+
+def line_follow_main():
+    """simple_line_follow.py 를 직접 실행했을 때의 메뉴"""
+    explain_line_following()
+    
+    print("\n어떤 테스트를 하시겠습니까?")
+    print("1. 라인 추적 원리 테스트 (안전)")
+    print("2. 실제 라인 추적 (기본 모드, 10초)")
+    print("3. 실제 라인 추적 (부드러운 모드, 10초)")
+    
+    choice = input("선택 (1-3): ").strip()
+    
+    if choice == "1":
+        test_line_following()
+    elif choice == "2":
+        start_line_following(smooth_mode=False, duration=10)
+    elif choice == "3":
+        start_line_following(smooth_mode=True, duration=10)
+    else:
+        print("잘못된 선택입니다")
+
+
+# ============ 장애물 회피 (simple_obstacle_avoid.py) ============
+
+
+def test_obstacle_detection():
+    """장애물 감지 기능을 테스트합니다"""
+    print("\n🧪 장애물 감지 테스트")
+    
+    if not setup_sensors():
+        print("❌ 센서 준비 실패")
+        return
+    
+    print("\n5초 동안 장애물 감지 테스트...")
+    
+    for i in range(25):  # 5초 = 25번 × 0.2초
+        distance = read_distance()
+        status = check_obstacle()
+        
+        if status == "safe":
+            icon = "✅"
+        elif status == "warning":
+            icon = "⚠️"
+        else:
+            icon = "🚨"
+        
+        print(f"{icon} 거리: {distance:3.0f}cm - {status}")
+        time.sleep(0.2)
+    
+    cleanup_sensors()
+    print("테스트 완료!")
+
+
+def test_avoidance_movement():
+    """장애물 회피 동작을 테스트합니다 (실제로 움직이지 않음)"""
+    print("\n🧪 장애물 회피 동작 테스트")
+    
+    if not setup_motors():
+        print("❌ 모터 준비 실패")
+        return
+    
+    print("\n장애물 회피 동작 시뮬레이션...")
+    print("(실제로는 움직이지 않고 출력만 합니다)")
+    
+    # 회피 동작 시뮬레이션
+    print("\n🚨 가상 장애물 발견!")
+    print("  1단계: 왼쪽으로 돌기")
+    print("  2단계: 앞으로 가기")
+    print("  3단계: 오른쪽으로 돌기")
+    print("✓ 회피 완료!")
+    
+    cleanup_motors()
+    print("테스트 완료!")
+
+
+def explain_obstacle_avoidance():
+    """장애물 회피 원리를 설명합니다"""
+    print("\n📚 장애물 회피 원리:")
+    print("="*50)
+    print("1. 초음파 센서로 앞의 거리를 측정합니다")
+    print(f"   - {SAFE_DISTANCE}cm 이상: 안전 (직진)")
+    print(f"   - {DANGER_DISTANCE}-{SAFE_DISTANCE}cm: 주의 (천천히)")
+    print(f"   - {DANGER_DISTANCE}cm 이하: 위험 (회피)")
+    print()
+    print("2. 회피 방법:")
+    print("   ① 왼쪽으로 돌기")
+    print("   ② 앞으로 가서 장애물 지나가기")
+    print("   ③ 오른쪽으로 돌아서 원래 방향으로")
+    print()
+    print("3. 설정 변경:")
+    print("   파일 상단의 SAFE_DISTANCE, DANGER_DISTANCE,")
+    print("   AVOID_TIME 값을 바꿔서 조정할 수 있습니다")
+
+
+def show_current_settings():
+    """현재 설정을 보여줍니다"""
+    print("\n⚙️ 현재 장애물 회피 설정:")
+    print(f"  안전 거리: {SAFE_DISTANCE}cm")
+    print(f"  위험 거리: {DANGER_DISTANCE}cm")
+    print(f"  회피 시간: {AVOID_TIME}초")
+
+
+def obstacle_avoid_main():
+    """simple_obstacle_avoid.py 를 직접 실행했을 때의 메뉴"""
+    explain_obstacle_avoidance()
+    show_current_settings()
+    
+    print("\n어떤 테스트를 하시겠습니까?")
+    print("1. 장애물 감지 테스트 (안전)")
+    print("2. 회피 동작 테스트 (안전)")
+    print("3. 실제 장애물 회피 (10초)")
+    
+    choice = input("선택 (1-3): ").strip()
+    
+    if choice == "1":
+        test_obstacle_detection()
+    elif choice == "2":
+        test_avoidance_movement()
+    elif choice == "3":
+        start_obstacle_avoidance(duration=10)
+    else:
+        print("잘못된 선택입니다")
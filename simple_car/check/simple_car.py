@@ -12,7 +12,7 @@ import time
 import sys
 
 # 우리가 만든 모듈들 가져오기
-from simple_sensors import read_line, read_distance, setup_sensors, cleanup_sensors
+from simple_sensors import read_line, read_distance, setup_sensors, cleanup_sensors, LinePos, LINE_LABELS
 from simple_motors import go_forward, turn_left, turn_right, stop, setup_motors, cleanup_motors, SPEED_NORMAL
 from simple_line_follow import follow_line_smooth
 from simple_obstacle_avoid import check_obstacle, avoid_obstacle_simple
@@ -66,7 +66,7 @@ def start_smart_car(duration=30):
         return
     
     print("✓ 준비 완료!")
-    start_time = time.time()
+    start_time = time.monotonic()
     
     # 통계
     stats = {
@@ -76,9 +76,12 @@ def start_smart_car(duration=30):
     }
     
     try:
+        _monotonic = time.monotonic
+        _sleep = time.sleep
+
         while True:
             # 시간 체크 (duration이 0이 아닌 경우)
-            if duration > 0 and (time.time() - start_time) > duration:
+            if duration > 0 and (_monotonic() - start_time) > duration:
                 print(f"\n⏰ {duration}초 완료!")
                 break
             
@@ -87,7 +90,7 @@ def start_smart_car(duration=30):
             stats[action] += 1
             
             # 잠시 대기
-            time.sleep(0.1)
+            _sleep(0.1)
             
     except KeyboardInterrupt:
         print("\n\n⌨️ Ctrl+C로 중단됨")
@@ -131,7 +134,7 @@ def test_all_functions():
         obstacle = check_obstacle()
         
         # 상태 출력
-        print(f"{i+1:2d}. 라인:{line_pos:6} | 거리:{distance:3.0f}cm | 장애물:{obstacle:7} → ", end="")
+        print(f"{i+1:2d}. 라인:{LINE_LABELS[line_pos]:6} | 거리:{distance:3.0f}cm | 장애물:{obstacle:7} → ", end="")
         
         # 어떤 동작을 할지 결정 (실제로는 움직이지 않음)
         if obstacle == "danger":
@@ -139,11 +142,11 @@ def test_all_functions():
         elif obstacle == "warning":
             print("천천히 직진")
         else:
-            if line_pos == "center":
+            if line_pos == LinePos.CENTER:
                 print("직진")
-            elif line_pos == "left":
+            elif line_pos == LinePos.LEFT:
                 print("오른쪽 회전")
-            elif line_pos == "right":
+            elif line_pos == LinePos.RIGHT:
                 print("왼쪽 회전")
             else:
                 print("라인 찾기")
@@ -8,33 +8,53 @@ Simple Line Following Module for High School Students
 이 모듈은 검은 선을 따라가는 기능을 쉽게 만들 수 있게 해줍니다.
 """
 
+import os
+import sys
 import time
+from functools import partial
 from simple_sensors import read_line, setup_sensors, cleanup_sensors
+
+# 실시간 스케줄링 도우미는 상위 폴더(simple_car)에 있음 - 한 번만 추가
+_SIMPLE_CAR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SIMPLE_CAR_DIR not in sys.path:
+    sys.path.insert(0, _SIMPLE_CAR_DIR)
+from _realtime import enable_realtime, restore_scheduling
 from simple_motors import go_forward, turn_left, turn_right, turn_left_gentle, turn_right_gentle, stop, setup_motors, cleanup_motors, SPEED_SLOW
 
 
+# 라인 추적 정책: 라인 위치 → 동작 표 (LinePos 순서: LEFT, CENTER, RIGHT, NONE)
+# 라인이 왼쪽에 있으면 오른쪽으로, 오른쪽에 있으면 왼쪽으로,
+# 라인이 없으면 찾기 위해 천천히 돌기
+POLICY_SIMPLE = (
+    turn_right,
+    go_forward,
+    turn_left,
+    partial(turn_left, SPEED_SLOW),
+)
+
+# 부드러운 정책: 회전만 완만한 회전으로 바꿈
+POLICY_SMOOTH = (
+    turn_right_gentle,
+    go_forward,
+    turn_left_gentle,
+    partial(turn_left, SPEED_SLOW),
+)
+
+
+def follow_line(policy):
+    """
+    라인 추적 한 번 실행
+    policy: POLICY_SIMPLE 또는 POLICY_SMOOTH
+    """
+    policy[read_line()]()
+
+
 def follow_line_simple():
     """
     간단한 라인 추적 (기본)
     검은 선을 보고 자동차가 따라갑니다
     """
-    line_position = read_line()
-    
-    if line_position == "center":
-        # 라인이 가운데 있으면 직진
-        go_forward()
-        
-    elif line_position == "left":
-        # 라인이 왼쪽에 있으면 오른쪽으로 가야 함
-        turn_right()
-        
-    elif line_position == "right":
-        # 라인이 오른쪽에 있으면 왼쪽으로 가야 함
-        turn_left()
-        
-    else:  # line_position == "none"
-        # 라인이 없으면 찾기 위해 천천히 돌기
-        turn_left(SPEED_SLOW)
+    follow_line(POLICY_SIMPLE)
 
 
 def follow_line_smooth():
@@ -42,23 +62,7 @@ def follow_line_smooth():
     부드러운 라인 추적 (개선된 버전)
     더 부드럽게 움직입니다
     """
-    line_position = read_line()
-    
-    if line_position == "center":
-        # 라인이 가운데 있으면 직진
-        go_forward()
-        
-    elif line_position == "left":
-        # 라인이 왼쪽에 있으면 부드럽게 오른쪽으로
-        turn_right_gentle()
-        
-    elif line_position == "right":
-        # 라인이 오른쪽에 있으면 부드럽게 왼쪽으로
-        turn_left_gentle()
-        
-    else:  # line_position == "none"
-        # 라인이 없으면 찾기 위해 천천히 돌기
-        turn_left(SPEED_SLOW)
+    follow_line(POLICY_SMOOTH)
 
 
 def start_line_following(smooth_mode=True, duration=10):
@@ -81,23 +85,29 @@ def start_line_following(smooth_mode=True, duration=10):
         print("❌ 모터 준비 실패")
         return
     
-    start_time = time.time()
+    # 끝나면 원래 스케줄링으로 되돌림 (메뉴와 다른 테스트는 보통 우선순위로)
+    saved_scheduling = enable_realtime()
+    
+    # 정책은 루프 밖에서 한 번만 고릅니다
+    policy = POLICY_SMOOTH if smooth_mode else POLICY_SIMPLE
+    start_time = time.monotonic()
     
     try:
+        # 루프 안에서 자주 쓰는 함수는 지역 변수로 꺼내 둡니다
+        _monotonic = time.monotonic
+        _sleep = time.sleep
+
         while True:
             # 시간 체크 (duration이 0이 아닌 경우)
-            if duration > 0 and (time.time() - start_time) > duration:
+            if duration > 0 and (_monotonic() - start_time) > duration:
                 print(f"\n⏰ {duration}초 완료!")
                 break
             
             # 라인 추적 실행
-            if smooth_mode:
-                follow_line_smooth()
-            else:
-                follow_line_simple()
+            follow_line(policy)
             
             # 잠시 대기 (너무 빠르게 반응하지 않도록)
-            time.sleep(0.1)
+            _sleep(0.1)
             
     except KeyboardInterrupt:
         print("\n\n⌨️ Ctrl+C로 중단됨")
@@ -107,79 +117,11 @@ def start_line_following(smooth_mode=True, duration=10):
         stop()
         cleanup_sensors()
         cleanup_motors()
+        restore_scheduling(saved_scheduling)
         print("✓ 라인 추적 종료")
 
 
-def test_line_following():
-    """라인 추적 기능을 테스트합니다"""
-    print("\n🧪 라인 추적 테스트")
-    
-    # 센서와 모터 준비
-    if not setup_sensors():
-        print("❌ 센서 준비 실패")
-        return
-        
-    if not setup_motors():
-        print("❌ 모터 준비 실패")
-        return
-    
-    print("\n5초 동안 라인 상태에 따른 동작 테스트...")
-    
-    for i in range(25):  # 5초 = 25번 × 0.2초
-        line_position = read_line()
-        print(f"라인 위치: {line_position:6} → ", end="")
-        
-        # 동작 결정 (실제로는 움직이지 않고 출력만)
-        if line_position == "center":
-            print("직진")
-        elif line_position == "left":
-            print("오른쪽으로 회전")
-        elif line_position == "right":
-            print("왼쪽으로 회전")
-        else:
-            print("라인 찾기")
-        
-        time.sleep(0.2)
-    
-    cleanup_sensors()
-    cleanup_motors()
-    print("테스트 완료!")
-
-
-def explain_line_following():
-    """라인 추적 원리를 설명합니다"""
-    print("\n📚 라인 추적 원리:")
-    print("="*50)
-    print("1. 센서가 검은 선의 위치를 확인합니다")
-    print("   - 'center': 선이 가운데 → 직진")
-    print("   - 'left':   선이 왼쪽   → 오른쪽으로 회전")
-    print("   - 'right':  선이 오른쪽 → 왼쪽으로 회전")
-    print("   - 'none':   선이 없음   → 찾기 위해 회전")
-    print()
-    print("2. 기본 모드 vs 부드러운 모드:")
-    print("   - 기본: 빠르게 반응 (급회전)")
-    print("   - 부드러운: 천천히 반응 (완만한 회전)")
-    print()
-    print("3. 사용법:")
-    print("   start_line_following(smooth_mode=True)  # 부드러운 모드")
-    print("   start_line_following(smooth_mode=False) # 기본 모드")
-
-
 if __name__ == "__main__":
-    explain_line_following()
-    
-    print("\n어떤 테스트를 하시겠습니까?")
-    print("1. 라인 추적 원리 테스트 (안전)")
-    print("2. 실제 라인 추적 (기본 모드, 10초)")
-    print("3. 실제 라인 추적 (부드러운 모드, 10초)")
-    
-    choice = input("선택 (1-3): ").strip()
-    
-    if choice == "1":
-        test_line_following()
-    elif choice == "2":
-        start_line_following(smooth_mode=False, duration=10)
-    elif choice == "3":
-        start_line_following(smooth_mode=True, duration=10)
-    else:
-        print("잘못된 선택입니다")
+    from _interactive import line_follow_main
+
+    line_follow_main()
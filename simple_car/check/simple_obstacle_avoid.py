@@ -9,6 +9,7 @@ Simple Obstacle Avoidance Module for High School Students
 """
 
 import time
+from bisect import bisect_right
 from simple_sensors import read_distance, is_obstacle_close, setup_sensors, cleanup_sensors
 from simple_motors import go_forward, turn_left, turn_right, stop, setup_motors, cleanup_motors, SPEED_NORMAL
 
@@ -17,6 +18,10 @@ SAFE_DISTANCE = 30      # 안전한 거리 (cm)
 DANGER_DISTANCE = 15    # 위험한 거리 (cm)
 AVOID_TIME = 0.8        # 회피 동작 시간 (초)
 
+# 거리 구간 경계와 구간별 상태 (모듈을 불러올 때 한 번만 만듭니다)
+_DISTANCE_BOUNDS = (DANGER_DISTANCE, SAFE_DISTANCE)
+_DISTANCE_STATUS = ("danger", "warning", "safe")
+
 
 def check_obstacle():
     """
@@ -27,14 +32,7 @@ def check_obstacle():
     - "warning": 주의 (15-30cm)
     - "danger": 위험함 (15cm 이하)
     """
-    distance = read_distance()
-    
-    if distance >= SAFE_DISTANCE:
-        return "safe"
-    elif distance >= DANGER_DISTANCE:
-        return "warning"
-    else:
-        return "danger"
+    return _DISTANCE_STATUS[bisect_right(_DISTANCE_BOUNDS, read_distance())]
 
 
 def avoid_obstacle_simple():
@@ -62,29 +60,39 @@ def avoid_obstacle_simple():
     print("✓ 장애물 회피 완료!")
 
 
+def _on_safe():
+    # 안전하면 직진
+    go_forward()
+
+
+def _on_warning():
+    # 주의하면 천천히 직진
+    print("⚠️ 장애물 주의! 천천히 직진")
+    go_forward(speed=SPEED_NORMAL // 2)  # 속도 절반으로
+
+
+def _on_danger():
+    # 위험하면 즉시 회피
+    print("🚨 장애물 위험! 즉시 회피")
+    avoid_obstacle_simple()
+
+
+# 장애물 상태 → 동작 표
+_SMART_ACTIONS = {
+    "safe": _on_safe,
+    "warning": _on_warning,
+    "danger": _on_danger,
+}
+
+
 def avoid_obstacle_smart():
     """
     똑똑한 장애물 회피 (방법 2)
     거리에 따라 다르게 반응합니다
     """
     obstacle_status = check_obstacle()
-    
-    if obstacle_status == "safe":
-        # 안전하면 직진
-        go_forward()
-        return "safe"
-        
-    elif obstacle_status == "warning":
-        # 주의하면 천천히 직진
-        print("⚠️ 장애물 주의! 천천히 직진")
-        go_forward(speed=SPEED_NORMAL // 2)  # 속도 절반으로
-        return "warning"
-        
-    else:  # obstacle_status == "danger"
-        # 위험하면 즉시 회피
-        print("🚨 장애물 위험! 즉시 회피")
-        avoid_obstacle_simple()
-        return "danger"
+    _SMART_ACTIONS[obstacle_status]()
+    return obstacle_status
 
 
 def start_obstacle_avoidance(duration=10):
@@ -107,12 +115,16 @@ def start_obstacle_avoidance(duration=10):
         print("❌ 모터 준비 실패")
         return
     
-    start_time = time.time()
+    start_time = time.monotonic()
     
     try:
+        # 시간 함수는 지역 변수로 (루프에서 매번 찾지 않도록)
+        _monotonic = time.monotonic
+        _sleep = time.sleep
+
         while True:
             # 시간 체크 (duration이 0이 아닌 경우)
-            if duration > 0 and (time.time() - start_time) > duration:
+            if duration > 0 and (_monotonic() - start_time) > duration:
                 print(f"\n⏰ {duration}초 완료!")
                 break
             
@@ -120,7 +132,7 @@ def start_obstacle_avoidance(duration=10):
             avoid_obstacle_smart()
             
             # 잠시 대기
-            time.sleep(0.2)
+            _sleep(0.2)
             
     except KeyboardInterrupt:
         print("\n\n⌨️ Ctrl+C로 중단됨")
@@ -133,99 +145,7 @@ def start_obstacle_avoidance(duration=10):
         print("✓ 장애물 회피 종료")
 
 
-def test_obstacle_detection():
-    """장애물 감지 기능을 테스트합니다"""
-    print("\n🧪 장애물 감지 테스트")
-    
-    if not setup_sensors():
-        print("❌ 센서 준비 실패")
-        return
-    
-    print("\n5초 동안 장애물 감지 테스트...")
-    
-    for i in range(25):  # 5초 = 25번 × 0.2초
-        distance = read_distance()
-        status = check_obstacle()
-        
-        if status == "safe":
-            icon = "✅"
-        elif status == "warning":
-            icon = "⚠️"
-        else:
-            icon = "🚨"
-        
-        print(f"{icon} 거리: {distance:3.0f}cm - {status}")
-        time.sleep(0.2)
-    
-    cleanup_sensors()
-    print("테스트 완료!")
-
-
-def test_avoidance_movement():
-    """장애물 회피 동작을 테스트합니다 (실제로 움직이지 않음)"""
-    print("\n🧪 장애물 회피 동작 테스트")
-    
-    if not setup_motors():
-        print("❌ 모터 준비 실패")
-        return
-    
-    print("\n장애물 회피 동작 시뮬레이션...")
-    print("(실제로는 움직이지 않고 출력만 합니다)")
-    
-    # 회피 동작 시뮬레이션
-    print("\n🚨 가상 장애물 발견!")
-    print("  1단계: 왼쪽으로 돌기")
-    print("  2단계: 앞으로 가기")
-    print("  3단계: 오른쪽으로 돌기")
-    print("✓ 회피 완료!")
-    
-    cleanup_motors()
-    print("테스트 완료!")
-
-
-def explain_obstacle_avoidance():
-    """장애물 회피 원리를 설명합니다"""
-    print("\n📚 장애물 회피 원리:")
-    print("="*50)
-    print("1. 초음파 센서로 앞의 거리를 측정합니다")
-    print(f"   - {SAFE_DISTANCE}cm 이상: 안전 (직진)")
-    print(f"   - {DANGER_DISTANCE}-{SAFE_DISTANCE}cm: 주의 (천천히)")
-    print(f"   - {DANGER_DISTANCE}cm 이하: 위험 (회피)")
-    print()
-    print("2. 회피 방법:")
-    print("   ① 왼쪽으로 돌기")
-    print("   ② 앞으로 가서 장애물 지나가기")
-    print("   ③ 오른쪽으로 돌아서 원래 방향으로")
-    print()
-    print("3. 설정 변경:")
-    print("   파일 상단의 SAFE_DISTANCE, DANGER_DISTANCE,")
-    print("   AVOID_TIME 값을 바꿔서 조정할 수 있습니다")
-
-
-def show_current_settings():
-    """현재 설정을 보여줍니다"""
-    print("\n⚙️ 현재 장애물 회피 설정:")
-    print(f"  안전 거리: {SAFE_DISTANCE}cm")
-    print(f"  위험 거리: {DANGER_DISTANCE}cm")
-    print(f"  회피 시간: {AVOID_TIME}초")
-
-
 if __name__ == "__main__":
-    explain_obstacle_avoidance()
-    show_current_settings()
-    
-    print("\n어떤 테스트를 하시겠습니까?")
-    print("1. 장애물 감지 테스트 (안전)")
-    print("2. 회피 동작 테스트 (안전)")
-    print("3. 실제 장애물 회피 (10초)")
-    
-    choice = input("선택 (1-3): ").strip()
-    
-    if choice == "1":
-        test_obstacle_detection()
-    elif choice == "2":
-        test_avoidance_movement()
-    elif choice == "3":
-        start_obstacle_avoidance(duration=10)
-    else:
-        print("잘못된 선택입니다")
+    from _interactive import obstacle_avoid_main
+
+    obstacle_avoid_main()
@@ -3,10 +3,24 @@
 # 설명: 함수형으로 만든 간단한 자율주행 로봇 메인 프로그램 (고등학생 수준)
 # 작성일: 2024
 
+import asyncio
+import os
+import queue
+import threading
 import time
 import signal
 import sys
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+
+# numba가 있으면 센서 융합 판단 함수를 기계어로 컴파일 (없으면 그냥 파이썬으로 실행)
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 
 # 우리가 만든 함수들 가져오기
 from autonomous_robot.utils.simple_rotary_functions import (
@@ -30,6 +44,19 @@ from autonomous_robot.utils.obstacle_avoidance_strategies import (
     reset_avoidance_state,
     print_avoidance_status_for_debugging,
 )
+# 실시간 스케줄링 도우미는 상위 폴더(simple_car)에 있음 - 한 번만 추가
+_SIMPLE_CAR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SIMPLE_CAR_DIR not in sys.path:
+    sys.path.insert(0, _SIMPLE_CAR_DIR)
+from _realtime import enable_realtime, get_scheduling, lock_memory, restore_scheduling
+
+# 라즈베리파이 환경인지 한 번만 확인 (main()이 다시 불려도 import를 반복하지 않음)
+try:
+    import RPi.GPIO  # 설치되어 있는지만 확인
+
+    IS_RASPBERRY_PI = True
+except ImportError:
+    IS_RASPBERRY_PI = False
 
 # =============================================================================
 # 전역 변수들 (로봇 상태 관리)
@@ -46,10 +73,83 @@ should_stop_robot = False  # 정지 신호 받았는지 여부
 
 # 성능 모니터링
 total_control_loops = 0  # 총 제어 루프 실행 횟수
-robot_start_time = 0.0  # 로봇 시작 시간
+robot_start_time = 0.0  # 로봇 시작 시간 (time.monotonic 기준)
+last_cycle_end_time = 0.0  # 마지막 제어 사이클이 끝난 시간 (감시 작업용 심장 박동)
+_waiting_for_input = False  # 명령 입력을 기다리는 중인지 (Ctrl+C로 바로 종료)
 
 # 제어 설정
 CONTROL_LOOP_INTERVAL = 0.1  # 제어 루프 주기 (100ms = 0.1초)
+STATUS_PRINT_INTERVAL = 10  # 몇 사이클마다 상태를 출력할지
+VERBOSE = False  # True면 매 사이클 판단 이유 문장을 만듦 (출력은 그대로 10번마다)
+
+# 화면이 아닌 곳(로그 파일 등)으로 출력 중이고 ROBOT_QUIET=1이면 주행 상태 출력을 생략
+_STDOUT_IS_TTY = sys.stdout.isatty()
+STATUS_OUTPUT_ENABLED = _STDOUT_IS_TTY or os.environ.get("ROBOT_QUIET") != "1"
+
+# 주행 상태 출력 틀 (한 번에 만들어서 한 번에 씀)
+_STATUS_TPL = (
+    "\n--- 사이클 {0} (소요시간: {1:.1f}ms) ---\n"
+    "행동: {2} | 속도: {3}%\n"
+    "제어: {4} | 우선순위: {5}\n"
+    "이유: {6}\n"
+    "라인: {7} | 로터리: {8}\n"
+)
+_OBSTACLE_TPL = "장애물: {0:.1f}cm ({1})\n"
+_OBSTACLE_FAIL_TEXT = "장애물: 측정 실패\n"
+SENSOR_WORKERS = 2  # 센서를 동시에 읽는 스레드 수 (라인, 초음파)
+STATUS_QUEUE_SIZE = 4  # 출력 대기열 크기 (가득 차면 상태 출력을 버림)
+WATCHDOG_INTERVAL = 1.0  # 감시 작업 확인 간격 (초)
+WATCHDOG_STALL_TIME = 1.0  # 이 시간 동안 제어 사이클이 안 끝나면 모터 정지 (초)
+WATCHDOG_MAX_CPU_TEMP = 80.0  # 이 온도 이상이면 경고 (°C)
+CPU_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"  # 라즈베리파이 CPU 온도
+
+# 실시간 모드로 바꾸기 전의 스케줄링 설정 (센서 스레드는 이 설정으로 실행)
+_NORMAL_SCHEDULING = get_scheduling()
+
+# 출력 전용 스레드 (느린 화면 출력이 제어 루프를 막지 않도록)
+_STATUS_Q: "queue.Queue" = queue.Queue(maxsize=STATUS_QUEUE_SIZE)
+_printer_thread = None
+
+# 매 사이클 다시 쓰는 결과 딕셔너리 (100ms마다 새 딕셔너리를 만들지 않음)
+# 반환된 딕셔너리는 다음 사이클에서 덮어쓰므로 바로 사용해야 합니다.
+# _SENSOR_BUF는 상태를 출력하는 사이클에만 채웁니다 (판단 함수는 값을 직접 받음).
+_SENSOR_BUF: Dict[str, Any] = {
+    "line_tracking": None,
+    "obstacle_detection": None,
+    "timestamp": 0.0,  # 센서를 읽기 시작한 시각 (time.monotonic 기준)
+}
+_DECISION_BUF: Dict[str, Any] = {
+    "final_action": "stop_all_motors",
+    "final_speed": 0,
+    "decision_reason": "",
+    "priority_level": "normal",
+    "controlling_system": "line_tracking",
+    "avoidance_strategy": None,  # 고급 회피일 때만 값이 있음
+    "noise_filtered": False,
+}
+# 센서 융합 판단용 숫자 코드 (문자열 비교 대신 정수로 판단)
+DANGER_SAFE, DANGER_CAUTION, DANGER_DANGEROUS, DANGER_VERY_DANGEROUS = range(4)
+_DANGER_CODES = {
+    "safe": DANGER_SAFE,
+    "unknown": DANGER_SAFE,  # 측정 실패는 안전과 같게 처리 (기존 동작)
+    "caution": DANGER_CAUTION,
+    "dangerous": DANGER_DANGEROUS,
+    "very_dangerous": DANGER_VERY_DANGEROUS,
+}
+FUSE_EMERGENCY, FUSE_AVOID, FUSE_LINE = range(3)  # 판단 결과 (누가 제어하는지)
+CAUTION_SPEED_RATIO = 0.7  # 장애물 주의일 때 라인 추적 속도 비율 (30% 감소)
+MAX_SPEED = 100  # 모터 속도 최댓값 (%)
+# 속도(0~100)별 주의 속도를 미리 계산한 표 (매번 곱셈 + int() 하지 않도록)
+_CAUTION_SPEED = tuple(
+    int(speed * CAUTION_SPEED_RATIO) for speed in range(MAX_SPEED + 1)
+)
+
+_CYCLE_BUF: Dict[str, Any] = {
+    "cycle_number": 0,
+    "cycle_duration_ms": 0.0,
+    "sensor_data": _SENSOR_BUF,
+    "control_decision": _DECISION_BUF,
+}
 
 
 # =============================================================================
@@ -94,11 +194,23 @@ def initialize_all_robot_hardware_systems() -> bool:
     return all_systems_ready
 
 
+def _use_normal_scheduling():
+    """
+    센서 스레드를 실시간 모드 전의 보통 스케줄링으로 되돌리는 함수
+
+    실시간 모드(메인 스레드)에서 만든 스레드는 RT_CPU 한 코어와 SCHED_FIFO를
+    물려받아서, 라인 읽기와 초음파 에코 대기가 동시에 돌 수 없게 됩니다.
+    """
+    restore_scheduling(_NORMAL_SCHEDULING)
+
+
 def handle_emergency_stop_signal(signal_number, frame):
     """
     Ctrl+C 같은 비상 정지 신호를 처리하는 함수
     """
     global should_stop_robot
+    if _waiting_for_input:
+        raise KeyboardInterrupt  # 명령 입력 중이면 바로 프로그램 종료
     print("\n🛑 비상 정지 신호 받음! 로봇을 안전하게 정지합니다...")
     should_stop_robot = True
 
@@ -121,8 +233,8 @@ def cleanup_all_robot_resources_before_exit():
     cleanup_all_motor_resources_safely()
     cleanup_ultrasonic_resources()
 
-    # 성능 통계 출력
-    print_final_performance_statistics()
+    # 성능 통계 출력 (출력 스레드가 끝낼 때까지 기다림)
+    post_status_output(print_final_performance_statistics, wait=True)
 
     print("✅ 모든 시스템이 안전하게 종료되었습니다.")
     print("👋 프로그램을 종료합니다. 안전한 하루 되세요!")
@@ -133,36 +245,64 @@ def cleanup_all_robot_resources_before_exit():
 # =============================================================================
 
 
-def collect_all_sensor_data_and_analyze() -> Dict[str, Any]:
+async def collect_all_sensor_data_and_analyze(
+    timestamp: Optional[float] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], float]:
     """
     모든 센서의 데이터를 수집하고 분석하는 함수
 
     이 함수는:
     1. 라인 센서 데이터를 읽고 로터리 상태를 분석
     2. 초음파 센서로 장애물을 감지
-    3. 두 정보를 합쳐서 반환
-    """
-
-    # 1단계: 라인 센서 + 로터리 분석
-    line_analysis = get_smart_driving_command_for_rotary_and_normal_sections(
-        LINE_SENSOR_LEFT_PIN, LINE_SENSOR_CENTER_PIN, LINE_SENSOR_RIGHT_PIN
+    3. (라인 분석, 장애물 분석, 시각)을 튜플로 반환
+
+    1, 2단계는 서로 상관없으므로 별도 스레드에서 동시에 실행합니다.
+    (초음파 에코를 기다리는 동안 라인 센서도 함께 읽음)
+
+    timestamp에 제어 사이클 시작 시각을 넘기면 시계를 다시 읽지 않습니다.
+    """
+    if timestamp is None:
+        timestamp = time.monotonic()
+    loop = asyncio.get_running_loop()
+
+    # 1단계: 라인 센서 + 로터리 분석, 2단계: 초음파 센서 장애물 분석 (동시에)
+    line_analysis, obstacle_analysis = await asyncio.gather(
+        loop.run_in_executor(
+            None,
+            get_smart_driving_command_for_rotary_and_normal_sections,
+            LINE_SENSOR_LEFT_PIN,
+            LINE_SENSOR_CENTER_PIN,
+            LINE_SENSOR_RIGHT_PIN,
+        ),
+        loop.run_in_executor(None, get_complete_obstacle_status_and_recommendation),
     )
 
-    # 2단계: 초음파 센서 장애물 분석
-    obstacle_analysis = get_complete_obstacle_status_and_recommendation()
+    # 3단계: 두 정보를 함께 반환 (딕셔너리로 감싸지 않음)
+    return line_analysis, obstacle_analysis, timestamp
 
-    # 3단계: 두 정보를 합쳐서 반환
-    combined_sensor_data = {
-        "line_tracking": line_analysis,
-        "obstacle_detection": obstacle_analysis,
-        "timestamp": time.time(),
-    }
 
-    return combined_sensor_data
+@njit("UniTuple(int64, 2)(int64, int64)", cache=True, fastmath=True)
+def _fuse_kernel(danger_code, line_speed):
+    """
+    센서 융합 판단의 숫자 부분 (numba로 컴파일되는 부분)
+
+    반환: (판단 결과 FUSE_*, 라인 추적일 때의 속도)
+    """
+    if danger_code == DANGER_VERY_DANGEROUS:
+        return FUSE_EMERGENCY, 0
+    if danger_code == DANGER_DANGEROUS:
+        return FUSE_AVOID, 0
+    if danger_code == DANGER_CAUTION:
+        if 0 <= line_speed <= MAX_SPEED:
+            return FUSE_LINE, _CAUTION_SPEED[line_speed]
+        return FUSE_LINE, int(line_speed * CAUTION_SPEED_RATIO)  # 표 밖의 속도
+    return FUSE_LINE, line_speed
 
 
 def decide_final_robot_action_using_sensor_fusion(
-    sensor_data: Dict[str, Any],
+    line_data: Dict[str, Any],
+    obstacle_data: Dict[str, Any],
+    with_reason: bool = True,
 ) -> Dict[str, Any]:
     """
     여러 센서의 정보를 종합해서 최종 로봇 행동을 결정하는 함수
@@ -171,64 +311,72 @@ def decide_final_robot_action_using_sensor_fusion(
     1. 초음파 센서 비상 상황 (10cm 이하) → 즉시 정지
     2. 초음파 센서 위험 상황 (20cm 이하) → 장애물 회피
     3. 일반 상황 → 라인 추적 (로터리 포함)
+
+    with_reason이 False면 판단 이유 문장(decision_reason)을 만들지 않습니다.
+    숫자 판단은 _fuse_kernel이 하고, 여기서는 문자열 ↔ 숫자 변환만 합니다.
     """
+    decision = _DECISION_BUF
+    decision["avoidance_strategy"] = None
+    decision["noise_filtered"] = False
 
-    line_data = sensor_data["line_tracking"]
-    obstacle_data = sensor_data["obstacle_detection"]
+    # 여러 번 쓰는 값은 한 번만 꺼내 둠 (매번 딕셔너리를 찾지 않도록)
+    danger = obstacle_data["danger_level"]
+    distance_cm = obstacle_data["distance_cm"]
+    danger_code = _DANGER_CODES.get(danger, DANGER_SAFE)
+    fuse_result, fused_speed = _fuse_kernel(danger_code, line_data["speed"])
 
     # 1순위: 매우 위험한 장애물 (즉시 정지)
-    if obstacle_data["danger_level"] == "very_dangerous":
-        return {
-            "final_action": "stop_all_motors",
-            "final_speed": 0,
-            "decision_reason": f"비상 정지! 장애물이 {obstacle_data['distance_cm']:.1f}cm 거리에 있음",
-            "priority_level": "emergency",
-            "controlling_system": "obstacle_avoidance",
-        }
+    if fuse_result == FUSE_EMERGENCY:
+        decision["final_action"] = "stop_all_motors"
+        decision["final_speed"] = 0
+        decision["decision_reason"] = (
+            f"비상 정지! 장애물이 {distance_cm:.1f}cm 거리에 있음"
+            if with_reason
+            else ""
+        )
+        decision["priority_level"] = "emergency"
+        decision["controlling_system"] = "obstacle_avoidance"
 
     # 2순위: 위험한 장애물 (고급 회피 전략 사용)
-    elif obstacle_data["danger_level"] in ["dangerous", "very_dangerous"]:
+    elif fuse_result == FUSE_AVOID:
         # 고급 장애물 회피 시스템 사용
         advanced_avoidance = get_complete_obstacle_avoidance_command(
-            obstacle_data["distance_cm"],
-            obstacle_data["danger_level"],
+            distance_cm,
+            danger,
             line_data["position"],
         )
 
-        return {
-            "final_action": advanced_avoidance["action"],
-            "final_speed": advanced_avoidance["speed"],
-            "decision_reason": f"고급 회피: {advanced_avoidance['reason']}",
-            "priority_level": advanced_avoidance.get("priority_level", "high"),
-            "controlling_system": "advanced_obstacle_avoidance",
-            "avoidance_strategy": advanced_avoidance.get(
-                "avoidance_strategy", "unknown"
-            ),
-            "noise_filtered": obstacle_data.get("noise_filtered", False),
-        }
+        decision["final_action"] = advanced_avoidance["action"]
+        decision["final_speed"] = advanced_avoidance["speed"]
+        decision["decision_reason"] = (
+            f"고급 회피: {advanced_avoidance['reason']}" if with_reason else ""
+        )
+        avoidance_get = advanced_avoidance.get
+        decision["priority_level"] = avoidance_get("priority_level", "high")
+        decision["controlling_system"] = "advanced_obstacle_avoidance"
+        decision["avoidance_strategy"] = avoidance_get("avoidance_strategy", "unknown")
+        decision["noise_filtered"] = obstacle_data.get("noise_filtered", False)
 
     # 3순위: 라인 추적 (로터리 포함) + 장애물 거리 고려 속도 조정
     else:
-        base_action = line_data["action"]
-        base_speed = line_data["speed"]
+        # 장애물 거리에 따른 속도 조정은 _fuse_kernel에서 (주의면 30% 감소)
+        caution = danger_code == DANGER_CAUTION
 
-        # 장애물 거리에 따른 속도 조정
-        if obstacle_data["danger_level"] == "caution":
-            adjusted_speed = int(base_speed * 0.7)  # 30% 속도 감소
+        decision["final_action"] = line_data["action"]
+        decision["final_speed"] = fused_speed
+        if with_reason:
             speed_reason = (
-                f", 장애물 주의로 속도 감소 ({obstacle_data['distance_cm']:.1f}cm)"
+                f", 장애물 주의로 속도 감소 ({distance_cm:.1f}cm)"
+                if caution
+                else ""
             )
+            decision["decision_reason"] = f"라인 추적: {line_data['reason']}{speed_reason}"
         else:
-            adjusted_speed = base_speed
-            speed_reason = ""
+            decision["decision_reason"] = ""
+        decision["priority_level"] = "normal"
+        decision["controlling_system"] = "line_tracking"
 
-        return {
-            "final_action": base_action,
-            "final_speed": adjusted_speed,
-            "decision_reason": f"라인 추적: {line_data['reason']}{speed_reason}",
-            "priority_level": "normal",
-            "controlling_system": "line_tracking",
-        }
+    return decision
 
 
 def execute_robot_control_command(control_command: Dict[str, Any]) -> None:
@@ -242,7 +390,7 @@ def execute_robot_control_command(control_command: Dict[str, Any]) -> None:
     execute_driving_action_with_speed(action, speed)
 
 
-def run_one_complete_control_cycle() -> Dict[str, Any]:
+async def run_one_complete_control_cycle() -> Dict[str, Any]:
     """
     하나의 완전한 제어 사이클을 실행하는 함수
 
@@ -251,35 +399,45 @@ def run_one_complete_control_cycle() -> Dict[str, Any]:
     3. 명령 실행
     4. 결과 반환
     """
-    global total_control_loops
+    global total_control_loops, last_cycle_end_time
 
-    cycle_start_time = time.time()
+    cycle_start_time = time.monotonic()
 
     # 1단계: 센서 데이터 수집 및 분석
-    sensor_data = collect_all_sensor_data_and_analyze()
+    # (사이클 시작 시각을 센서 데이터 시각으로도 사용 - 시계는 시작/끝 두 번만 읽음)
+    line_data, obstacle_data, timestamp = await collect_all_sensor_data_and_analyze(
+        cycle_start_time
+    )
 
-    # 2단계: 최종 행동 결정
-    control_decision = decide_final_robot_action_using_sensor_fusion(sensor_data)
+    # 2단계: 최종 행동 결정 (이유 문장은 상태를 출력할 사이클에만 만듦)
+    status_cycle = (
+        STATUS_OUTPUT_ENABLED
+        and (total_control_loops + 1) % STATUS_PRINT_INTERVAL == 0
+    )
+    control_decision = decide_final_robot_action_using_sensor_fusion(
+        line_data, obstacle_data, VERBOSE or status_cycle
+    )
 
     # 3단계: 명령 실행
     execute_robot_control_command(control_decision)
 
     # 4단계: 통계 업데이트
     total_control_loops += 1
-    cycle_duration = time.time() - cycle_start_time
-
-    # 결과 정보 구성
-    cycle_result = {
-        "cycle_number": total_control_loops,
-        "cycle_duration_ms": cycle_duration * 1000,
-        "sensor_data": sensor_data,
-        "control_decision": control_decision,
-    }
+    last_cycle_end_time = time.monotonic()
+    cycle_duration = last_cycle_end_time - cycle_start_time
+
+    # 결과 정보 구성 (미리 만든 딕셔너리에 채움, 센서 값은 출력할 때만)
+    if status_cycle:
+        _SENSOR_BUF["line_tracking"] = line_data
+        _SENSOR_BUF["obstacle_detection"] = obstacle_data
+        _SENSOR_BUF["timestamp"] = timestamp
+    _CYCLE_BUF["cycle_number"] = total_control_loops
+    _CYCLE_BUF["cycle_duration_ms"] = cycle_duration * 1000
 
-    return cycle_result
+    return _CYCLE_BUF
 
 
-def main_autonomous_driving_loop():
+async def main_autonomous_driving_loop():
     """
     메인 자율주행 루프 함수
 
@@ -293,24 +451,31 @@ def main_autonomous_driving_loop():
     print("🚗 자율주행 시작!")
     print("🛑 정지하려면 Ctrl+C를 누르세요\n")
 
-    robot_start_time = time.time()
+    # 시간 측정은 모두 time.monotonic (시스템 시계가 바뀌어도 뒤로 가지 않음)
+    robot_start_time = next_tick = time.monotonic()
     is_robot_running = True
 
     try:
         while is_robot_running and not should_stop_robot:
-            loop_start_time = time.time()
-
             # 한 번의 완전한 제어 사이클 실행
-            cycle_result = run_one_complete_control_cycle()
-
-            # 주기적으로 상태 출력 (10번마다)
-            if cycle_result["cycle_number"] % 10 == 0:
-                print_current_driving_status(cycle_result)
-
-            # 정확한 제어 주기 유지
-            loop_duration = time.time() - loop_start_time
-            sleep_time = max(0, CONTROL_LOOP_INTERVAL - loop_duration)
-            time.sleep(sleep_time)
+            cycle_result = await run_one_complete_control_cycle()
+
+            # 주기적으로 상태 출력 (10번마다, 출력 스레드가 대신 출력)
+            if (
+                STATUS_OUTPUT_ENABLED
+                and cycle_result["cycle_number"] % STATUS_PRINT_INTERVAL == 0
+            ):
+                post_status_output(
+                    print_current_driving_status, snapshot_cycle_result(cycle_result)
+                )
+
+            # 정확한 제어 주기 유지 (오차가 쌓이지 않도록 다음 목표 시각 기준)
+            next_tick += CONTROL_LOOP_INTERVAL
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                await asyncio.sleep(sleep_time)
+            else:
+                next_tick = time.monotonic()  # 늦어졌으면 지금부터 다시 시작
 
     except Exception as error:
         print(f"❌ 자율주행 중 오류 발생: {error}")
@@ -319,6 +484,7 @@ def main_autonomous_driving_loop():
     finally:
         is_robot_running = False
         stop_all_motors_immediately()
+        flush_status_output()  # 밀린 상태 출력이 끝난 뒤에 종료 메시지
         print("\n✅ 자율주행 루프 종료")
 
 
@@ -327,34 +493,112 @@ def main_autonomous_driving_loop():
 # =============================================================================
 
 
+def _printer_worker() -> None:
+    """대기열에서 (출력 함수, 인자)를 꺼내 차례로 실행하는 출력 스레드"""
+    while True:
+        print_func, args = _STATUS_Q.get()
+        try:
+            print_func(*args)
+        except Exception as error:
+            print(f"⚠️ 상태 출력 오류: {error}")
+        finally:
+            _STATUS_Q.task_done()
+
+
+def start_status_printer() -> None:
+    """
+    출력 스레드를 시작하는 함수
+
+    enable_realtime() 전에 호출해야 출력 스레드가 보통 우선순위로 남습니다.
+    (실시간 설정은 그 뒤에 만든 스레드만 물려받음)
+    """
+    global _printer_thread
+    if _printer_thread is None:
+        _printer_thread = threading.Thread(target=_printer_worker, daemon=True)
+        _printer_thread.start()
+
+
+def post_status_output(print_func, *args, wait: bool = False) -> None:
+    """
+    출력 작업을 출력 스레드에 넘기는 함수
+
+    제어 루프에서는 기다리지 않고, 대기열이 가득 차면 그 출력은 버립니다.
+    wait=True면 자리가 날 때까지 기다리고 출력이 끝날 때까지 기다립니다.
+    출력 스레드가 없으면 (센서 테스트 등) 그 자리에서 바로 출력합니다.
+    """
+    if _printer_thread is None:
+        print_func(*args)
+        return
+
+    if wait:
+        _STATUS_Q.put((print_func, args))
+        _STATUS_Q.join()
+        return
+
+    try:
+        _STATUS_Q.put_nowait((print_func, args))
+    except queue.Full:
+        pass  # 화면 출력보다 제어 주기가 더 중요함
+
+
+def flush_status_output() -> None:
+    """출력 스레드에 쌓인 출력이 모두 끝날 때까지 기다리는 함수"""
+    if _printer_thread is not None:
+        _STATUS_Q.join()
+
+
+def snapshot_cycle_result(cycle_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    출력 스레드에 넘길 사이클 결과 복사본을 만드는 함수
+
+    _CYCLE_BUF 등은 다음 사이클에서 덮어쓰므로 출력할 값만 얕게 복사합니다.
+    (센서 분석 결과는 매번 새 딕셔너리라 그대로 넘겨도 됨)
+    """
+    sensor_data = cycle_result["sensor_data"]
+    return {
+        "cycle_number": cycle_result["cycle_number"],
+        "cycle_duration_ms": cycle_result["cycle_duration_ms"],
+        "sensor_data": {
+            "line_tracking": sensor_data["line_tracking"],
+            "obstacle_detection": sensor_data["obstacle_detection"],
+        },
+        "control_decision": dict(cycle_result["control_decision"]),
+    }
+
+
 def print_current_driving_status(cycle_result: Dict[str, Any]) -> None:
     """
     현재 주행 상태를 화면에 출력하는 함수
+    (여러 줄을 한 문자열로 만들어 한 번에 쓰고 flush도 한 번만 함)
     """
-    cycle_num = cycle_result["cycle_number"]
-    duration_ms = cycle_result["cycle_duration_ms"]
     decision = cycle_result["control_decision"]
     sensor_data = cycle_result["sensor_data"]
 
-    print(f"\n--- 사이클 {cycle_num} (소요시간: {duration_ms:.1f}ms) ---")
-    print(f"행동: {decision['final_action']} | 속도: {decision['final_speed']}%")
-    print(
-        f"제어: {decision['controlling_system']} | 우선순위: {decision['priority_level']}"
-    )
-    print(f"이유: {decision['decision_reason']}")
-
     # 센서 상세 정보
     line_info = sensor_data["line_tracking"]
     obstacle_info = sensor_data["obstacle_detection"]
 
-    print(f"라인: {line_info['current_sensor']} | 로터리: {line_info['rotary_status']}")
-
-    if obstacle_info["distance_cm"]:
-        print(
-            f"장애물: {obstacle_info['distance_cm']:.1f}cm ({obstacle_info['danger_level']})"
-        )
+    distance_cm = obstacle_info["distance_cm"]
+    if distance_cm:
+        obstacle_text = _OBSTACLE_TPL.format(distance_cm, obstacle_info["danger_level"])
     else:
-        print("장애물: 측정 실패")
+        obstacle_text = _OBSTACLE_FAIL_TEXT
+
+    sys.stdout.write(
+        _STATUS_TPL.format(
+            cycle_result["cycle_number"],
+            cycle_result["cycle_duration_ms"],
+            decision["final_action"],
+            decision["final_speed"],
+            decision["controlling_system"],
+            decision["priority_level"],
+            decision["decision_reason"],
+            line_info["current_sensor"],
+            line_info["rotary_status"],
+        )
+        + obstacle_text
+    )
+    sys.stdout.flush()
 
 
 def print_final_performance_statistics() -> None:
@@ -362,7 +606,7 @@ def print_final_performance_statistics() -> None:
     프로그램 종료 시 최종 성능 통계를 출력하는 함수
     """
     if robot_start_time > 0:
-        total_runtime = time.time() - robot_start_time
+        total_runtime = time.monotonic() - robot_start_time
         average_frequency = (
             total_control_loops / total_runtime if total_runtime > 0 else 0
         )
@@ -386,7 +630,7 @@ def show_help_menu() -> None:
     print("  'r' - 시스템 재시작")
 
 
-def test_all_sensors_step_by_step() -> None:
+async def test_all_sensors_step_by_step() -> None:
     """
     모든 센서를 단계별로 테스트하는 함수
     """
@@ -396,10 +640,9 @@ def test_all_sensors_step_by_step() -> None:
         print(f"\n--- 테스트 {i+1}/5 ---")
 
         # 센서 데이터 수집
-        sensor_data = collect_all_sensor_data_and_analyze()
+        line_info, obstacle_info, _ = await collect_all_sensor_data_and_analyze()
 
         # 라인 센서 정보
-        line_info = sensor_data["line_tracking"]
         print(
             f"라인 센서: {line_info['current_sensor']} | 로터리: {line_info['rotary_status']}"
         )
@@ -408,7 +651,6 @@ def test_all_sensors_step_by_step() -> None:
         )
 
         # 초음파 센서 정보
-        obstacle_info = sensor_data["obstacle_detection"]
         if obstacle_info["distance_cm"]:
             print(
                 f"초음파 센서: {obstacle_info['distance_cm']:.1f}cm ({obstacle_info['danger_level']})"
@@ -416,7 +658,7 @@ def test_all_sensors_step_by_step() -> None:
         else:
             print("초음파 센서: 측정 실패")
 
-        time.sleep(1)
+        await asyncio.sleep(1)
 
     print("✅ 센서 테스트 완료!")
 
@@ -426,34 +668,128 @@ def test_all_sensors_step_by_step() -> None:
 # =============================================================================
 
 
-def get_user_command_and_process() -> str:
+async def read_user_input_line(prompt: str) -> str:
+    """
+    명령 한 줄을 기다리는 함수 (기다리는 동안 감시 작업도 계속 실행됨)
+
+    input()처럼 멈춰 있지 않고, 이벤트 루프의 selector에 표준 입력을 등록해서
+    글자가 들어왔을 때만 읽습니다. 입력이 끝나면(EOF) EOFError를 냅니다.
+    """
+    global _waiting_for_input
+
+    loop = asyncio.get_running_loop()
+    line_future = loop.create_future()
+
+    def on_stdin_ready():
+        if not line_future.done():
+            line_future.set_result(sys.stdin.readline())
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    _waiting_for_input = True
+    try:
+        try:
+            loop.add_reader(sys.stdin.fileno(), on_stdin_ready)
+        except (NotImplementedError, ValueError, OSError):
+            return input()  # selector에 등록할 수 없는 입력이면 예전 방식
+
+        try:
+            line = await line_future
+        finally:
+            loop.remove_reader(sys.stdin.fileno())
+    finally:
+        _waiting_for_input = False
+
+    if not line:
+        raise EOFError
+    return line
+
+
+async def watch_robot_health() -> None:
+    """
+    1초마다 로봇 상태를 확인하는 감시 작업
+
+    - 자율주행 중인데 제어 사이클이 WATCHDOG_STALL_TIME 동안 안 끝나면 모터 정지
+    - CPU 온도가 WATCHDOG_MAX_CPU_TEMP 이상이면 경고
+    """
+    stall_reported = False
+    while True:
+        await asyncio.sleep(WATCHDOG_INTERVAL)
+
+        # 심장 박동 확인 (센서 읽기가 멈추면 모터가 마지막 명령대로 계속 달림)
+        stalled = (
+            is_robot_running
+            and time.monotonic() - max(last_cycle_end_time, robot_start_time)
+            > WATCHDOG_STALL_TIME
+        )
+        if stalled and not stall_reported:
+            print("\n⚠️ 제어 사이클 응답 없음 - 모터를 정지합니다")
+            stop_all_motors_immediately()
+        stall_reported = stalled
+
+        # CPU 온도 확인 (라즈베리파이가 아니면 건너뜀)
+        try:
+            with open(CPU_TEMP_PATH) as temp_file:
+                cpu_temp = int(temp_file.read()) / 1000
+        except (OSError, ValueError):
+            continue
+        if cpu_temp >= WATCHDOG_MAX_CPU_TEMP:
+            print(f"\n🌡️ CPU 온도 높음: {cpu_temp:.1f}°C")
+
+
+async def _on_start_command() -> str:
+    return "start_driving"
+
+
+async def _on_quit_command() -> str:
+    return "quit_program"
+
+
+async def _on_help_command() -> str:
+    show_help_menu()
+    return "continue"
+
+
+async def _on_test_command() -> str:
+    await test_all_sensors_step_by_step()
+    return "continue"
+
+
+async def _on_restart_command() -> str:
+    return "restart_system"
+
+
+async def _on_unknown_command() -> str:
+    print("❓ 알 수 없는 명령입니다. 'h'를 입력하여 도움말을 확인하세요.")
+    return "continue"
+
+
+# 명령 글자 → 처리 함수 (새 명령은 여기에 한 줄 추가)
+_COMMAND_TABLE = {
+    "s": _on_start_command,
+    "q": _on_quit_command,
+    "h": _on_help_command,
+    "t": _on_test_command,
+    "r": _on_restart_command,
+}
+
+
+async def get_user_command_and_process() -> str:
     """
     사용자로부터 명령을 받아서 처리하는 함수
     """
     try:
-        command = input("\n🎮 명령 입력 (h:도움말): ").strip().lower()
-
-        if command == "s":
-            return "start_driving"
-        elif command == "q":
-            return "quit_program"
-        elif command == "h":
-            show_help_menu()
-            return "continue"
-        elif command == "t":
-            test_all_sensors_step_by_step()
-            return "continue"
-        elif command == "r":
-            return "restart_system"
-        else:
-            print("❓ 알 수 없는 명령입니다. 'h'를 입력하여 도움말을 확인하세요.")
-            return "continue"
+        line = await read_user_input_line("\n🎮 명령 입력 (h:도움말): ")
+        command = line.strip().lower()
+
+        handler = _COMMAND_TABLE.get(command, _on_unknown_command)
+        return await handler()
 
     except (EOFError, KeyboardInterrupt):
         return "quit_program"
 
 
-def start_autonomous_driving_with_countdown() -> None:
+async def start_autonomous_driving_with_countdown() -> None:
     """
     3초 카운트다운 후 자율주행을 시작하는 함수
     """
@@ -464,10 +800,10 @@ def start_autonomous_driving_with_countdown() -> None:
     # 3초 카운트다운
     for i in range(3, 0, -1):
         print(f"⏰ {i}초 후 시작...")
-        time.sleep(1)
+        await asyncio.sleep(1)
 
     # 자율주행 시작
-    main_autonomous_driving_loop()
+    await main_autonomous_driving_loop()
 
 
 def restart_robot_system() -> bool:
@@ -500,6 +836,38 @@ def restart_robot_system() -> bool:
 # =============================================================================
 
 
+async def run_user_interface() -> None:
+    """
+    사용자 명령 루프 (감시 작업과 같은 이벤트 루프에서 함께 실행)
+    """
+    # 센서 스레드는 보통 우선순위로 모든 코어에서 (제어 루프만 실시간)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=SENSOR_WORKERS, initializer=_use_normal_scheduling
+        )
+    )
+    watchdog = asyncio.ensure_future(watch_robot_health())
+    try:
+        while True:
+            command_result = await get_user_command_and_process()
+
+            if command_result == "start_driving":
+                await start_autonomous_driving_with_countdown()
+
+            elif command_result == "restart_system":
+                if not restart_robot_system():
+                    print("시스템 재시작 실패. 프로그램을 종료합니다.")
+                    break
+
+            elif command_result == "quit_program":
+                break
+
+            # 'continue'인 경우 계속 루프
+
+    finally:
+        watchdog.cancel()
+
+
 def main():
     """
     프로그램의 메인 함수
@@ -515,15 +883,21 @@ def main():
     # 비상 정지 신호 처리 설정
     signal.signal(signal.SIGINT, handle_emergency_stop_signal)
 
-    # 라즈베리파이 환경 확인
-    try:
-        import RPi.GPIO as GPIO
-
+    # 라즈베리파이 환경 확인 (모듈을 불러올 때 한 번만 확인해 둠)
+    if IS_RASPBERRY_PI:
         print("✅ 라즈베리파이 환경 감지")
-    except ImportError:
+    else:
         print("⚠️ 라즈베리파이가 아닌 환경에서 실행 중")
         print("   일부 기능이 제한될 수 있습니다.")
 
+    # 출력 스레드는 실시간 모드 전에 시작 (보통 우선순위로 남도록)
+    start_status_printer()
+
+    # 실시간 모드 (메모리 고정 + 메인 스레드를 RT_CPU 코어에서 SCHED_FIFO로)
+    # 권한 예: sudo setcap cap_sys_nice,cap_ipc_lock+ep $(which python3)
+    lock_memory()
+    enable_realtime()
+
     # 하드웨어 초기화
     if not initialize_all_robot_hardware_systems():
         print("❌ 하드웨어 초기화 실패로 프로그램을 종료합니다.")
@@ -532,23 +906,9 @@ def main():
     print("\n🎉 로봇이 준비되었습니다!")
     show_help_menu()
 
-    # 메인 사용자 인터페이스 루프
+    # 메인 사용자 인터페이스 루프 (명령 입력 + 감시 작업)
     try:
-        while True:
-            command_result = get_user_command_and_process()
-
-            if command_result == "start_driving":
-                start_autonomous_driving_with_countdown()
-
-            elif command_result == "restart_system":
-                if not restart_robot_system():
-                    print("시스템 재시작 실패. 프로그램을 종료합니다.")
-                    break
-
-            elif command_result == "quit_program":
-                break
-
-            # 'continue'인 경우 계속 루프
+        asyncio.run(run_user_interface())
 
     except KeyboardInterrupt:
         print("\n⚠️ Ctrl+C 감지 - 비상 정지")
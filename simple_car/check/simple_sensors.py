@@ -10,6 +10,8 @@ Simple Sensor Reading Module for High School Students
 
 import time
 import random
+import statistics
+from enum import IntEnum
 
 # 하드웨어 모듈 가져오기
 try:
@@ -21,14 +23,46 @@ except ImportError:
     HARDWARE_AVAILABLE = False
     print("⚠️ 시뮬레이션 모드")
 
+
+class LinePos(IntEnum):
+    """라인 위치 (정수라서 비교와 표 찾기가 빠릅니다)"""
+    LEFT = 0
+    CENTER = 1
+    RIGHT = 2
+    NONE = 3
+
+
+# 출력할 때만 쓰는 라인 위치 이름 (LinePos 순서와 같음)
+LINE_LABELS = ("left", "center", "right", "none")
+
+# 시뮬레이션용 선택지와 확률 (center가 가장 높은 확률)
+_SIM_LINE_OPTIONS = (LinePos.LEFT, LinePos.CENTER, LinePos.RIGHT, LinePos.NONE)
+_SIM_LINE_WEIGHTS = (20, 50, 20, 10)
+
+# 초음파 센서 설정
+DISTANCE_SAMPLES = 5          # 중앙값을 구할 최근 측정 개수
+MIN_TRIGGER_INTERVAL = 0.04   # 초음파 측정 최소 간격 (초) - HC-SR04 한계
+
 # 전역 변수 - 센서 객체들
 line_sensor = None
 ultrasonic_sensor = None
 
+# 라인 위치를 받을 버퍼 (read_line마다 새로 만들지 않음)
+_line_buf = [None]
+
+# 최근 거리 측정값 (링 버퍼)
+_distance_ring = [999] * DISTANCE_SAMPLES
+_distance_idx = 0
+_last_trigger = float("-inf")
+
 
 def setup_sensors():
     """센서들을 준비합니다"""
-    global line_sensor, ultrasonic_sensor
+    global line_sensor, ultrasonic_sensor, _distance_idx, _last_trigger
+    
+    _distance_ring[:] = [999] * DISTANCE_SAMPLES
+    _distance_idx = 0
+    _last_trigger = float("-inf")
     
     if HARDWARE_AVAILABLE:
         try:
@@ -48,30 +82,30 @@ def read_line():
     """
     라인 센서를 읽습니다
     
-    반환값:
-    - "left": 라인이 왼쪽에 있음 (오른쪽으로 가야 함)
-    - "center": 라인이 가운데 있음 (직진)  
-    - "right": 라인이 오른쪽에 있음 (왼쪽으로 가야 함)
-    - "none": 라인이 없음 (찾아야 함)
+    반환값 (LinePos):
+    - LinePos.LEFT: 라인이 왼쪽에 있음 (오른쪽으로 가야 함)
+    - LinePos.CENTER: 라인이 가운데 있음 (직진)  
+    - LinePos.RIGHT: 라인이 오른쪽에 있음 (왼쪽으로 가야 함)
+    - LinePos.NONE: 라인이 없음 (찾아야 함)
+    
+    이름이 필요하면 LINE_LABELS[위치] 로 바꿀 수 있습니다
     """
     if line_sensor:
         # 실제 센서 사용
-        line_info = line_sensor.get_line_position()
-        position = line_info["position"]
+        line_sensor.get_line_position_fast(_line_buf)
+        position = _line_buf[0]
         
         if position is None:
-            return "none"
+            return LinePos.NONE
         elif position < -0.3:
-            return "left"
+            return LinePos.LEFT
         elif position > 0.3:
-            return "right"
+            return LinePos.RIGHT
         else:
-            return "center"
+            return LinePos.CENTER
     else:
         # 시뮬레이션 - 랜덤하게 반환
-        options = ["left", "center", "right", "none"]
-        weights = [20, 50, 20, 10]  # center가 가장 높은 확률
-        return random.choices(options, weights=weights)[0]
+        return random.choices(_SIM_LINE_OPTIONS, weights=_SIM_LINE_WEIGHTS)[0]
 
 
 def read_distance():
@@ -79,12 +113,19 @@ def read_distance():
     초음파 센서로 앞의 거리를 측정합니다
     
     반환값:
-    - 거리 (cm 단위)
+    - 거리 (cm 단위) - 최근 5번 측정값의 중앙값 (튀는 값 무시)
     """
+    global _distance_idx, _last_trigger
+    
     if ultrasonic_sensor:
-        # 실제 센서 사용
-        distance = ultrasonic_sensor.measure_distance()
-        return distance if distance is not None else 999
+        # 실제 센서 사용 (40ms보다 자주 부르면 이전 값들의 중앙값만 돌려줌)
+        now = time.monotonic()
+        if now - _last_trigger >= MIN_TRIGGER_INTERVAL:
+            distance = ultrasonic_sensor.measure_distance()
+            _distance_ring[_distance_idx % DISTANCE_SAMPLES] = distance if distance is not None else 999
+            _distance_idx += 1
+            _last_trigger = now
+        return statistics.median(_distance_ring)
     else:
         # 시뮬레이션 - 대부분 안전한 거리
         if random.random() < 0.1:  # 10% 확률로 장애물
@@ -119,27 +160,7 @@ def cleanup_sensors():
         print(f"센서 정리 중 오류: {e}")
 
 
-# 테스트 함수
-def test_sensors():
-    """센서들을 테스트합니다"""
-    print("\n🧪 센서 테스트")
-    
-    if not setup_sensors():
-        print("❌ 센서 준비 실패")
-        return
-    
-    print("\n5초 동안 센서 읽기...")
-    for i in range(10):
-        line_result = read_line()
-        distance = read_distance()
-        obstacle = is_obstacle_close()
-        
-        print(f"{i+1}. 라인: {line_result:6} | 거리: {distance:3.0f}cm | 장애물: {'예' if obstacle else '아니오'}")
-        time.sleep(0.5)
-    
-    cleanup_sensors()
-    print("테스트 완료!")
-
-
 if __name__ == "__main__":
-    test_sensors()
+    from _interactive import sensors_main
+
+    sensors_main()
@@ -12,6 +12,29 @@ Ultra Simple Autonomous Car for High School Students
 """
 
 import time
+import random
+import selectors
+import socket
+import threading
+from dataclasses import dataclass
+from enum import IntEnum
+
+# numpy가 있으면 시뮬레이션 값을 한 번에 뽑음 (없으면 random 모듈 사용)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba가 있으면 주행 판단 함수를 기계어로 컴파일 (없으면 그냥 파이썬으로 실행)
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# 실시간 스케줄링 도우미 (check/ 폴더 프로그램들과 같은 코드 사용)
+from _realtime import enable_realtime, restore_scheduling
 
 # 하드웨어 가져오기
 import sys
@@ -20,6 +43,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
+    import RPi.GPIO as GPIO
     from hardware.test_line_sensors import LineSensorController
     from hardware.test_gear_motors import GearMotorController
     from hardware.test_ultrasonic_sensor import UltrasonicSensor
@@ -36,170 +60,364 @@ LOW_TURN_SPEED = 40  # 회전 속도
 HIGH_TURN_SPEED = 100  # 회전 속도
 SAFE_DISTANCE = 10  # 장애물 안전 거리 (cm)
 AVOID_TIME = 0.8  # 회피 동작 시간 (초)
+DISTANCE_CHECK_INTERVAL = 0.1  # 라인 변화가 없을 때 거리 확인 간격 (초)
+SENSOR_INTERVAL = 0.02  # 센서 스레드가 센서를 읽는 간격 (초)
+SENSOR_TIMEOUT = 0.5  # 센서 값이 이보다 오래되면 차를 멈춤 (초)
 
-# 하드웨어 객체들
-line_sensor = None
-motor = None
-ultrasonic = None
+# 모터 채널 번호 (GearMotorController.CH_A / CH_B와 같은 값)
+CH_R = 0  # 오른쪽 모터 (A)
+CH_L = 1  # 왼쪽 모터 (B)
 
 
-def setup():
-    """하드웨어 준비"""
-    global line_sensor, motor, ultrasonic
+class LinePos(IntEnum):
+    """라인 위치 (정수라서 비교와 표 찾기가 빠릅니다)"""
+    LEFT = 0
+    CENTER = 1
+    RIGHT = 2
+    NONE = 3
+
+
+# 출력할 때만 쓰는 라인 위치 이름 (LinePos 순서와 같음)
+LINE_LABELS = ("left", "center", "right", "none")
+
 
+@dataclass
+class CarHW:
+    """하드웨어 객체 묶음 (시뮬레이션이면 모두 None)"""
+
+    __slots__ = ("line_sensor", "motor", "ultrasonic")
+    line_sensor: object
+    motor: object
+    ultrasonic: object
+
+
+def setup():
+    """하드웨어 준비 (성공하면 CarHW, 실패하면 None 반환)"""
     if not SIMULATION:
         try:
-            line_sensor = LineSensorController()
-            motor = GearMotorController()
-            ultrasonic = UltrasonicSensor()
+            hw = CarHW(
+                line_sensor=LineSensorController(),
+                motor=GearMotorController(),
+                ultrasonic=UltrasonicSensor(),
+            )
             print("✓ 하드웨어 준비 완료")
-            return True
+            return hw
         except Exception as e:
             print(f"❌ 하드웨어 오류: {e}")
-            return False
+            return None
     else:
         print("✓ 시뮬레이션 준비 완료")
-        return True
+        return CarHW(line_sensor=None, motor=None, ultrasonic=None)
+
 
+# 시뮬레이션 난수: SIM_BATCH개씩 미리 뽑아 두고 하나씩 꺼내 씀
+SIM_BATCH = 1024
+_rng = np.random.default_rng() if np is not None else None
+_LINE_CHOICES = tuple(LinePos)
+_sim_lines = []
+_sim_line_idx = SIM_BATCH
+_sim_distances = []
+_sim_distance_idx = SIM_BATCH
+
+
+def _next_sim_line():
+    """미리 뽑아 둔 라인 위치 하나 꺼내기 (다 쓰면 새로 뽑음)"""
+    global _sim_lines, _sim_line_idx
+    if _sim_line_idx == SIM_BATCH:
+        if _rng is not None:
+            indexes = _rng.integers(0, 4, SIM_BATCH)
+        else:
+            indexes = [random.randrange(4) for _ in range(SIM_BATCH)]
+        _sim_lines = [_LINE_CHOICES[i] for i in indexes]
+        _sim_line_idx = 0
+    line = _sim_lines[_sim_line_idx]
+    _sim_line_idx += 1
+    return line
+
+
+def _next_sim_distance():
+    """미리 뽑아 둔 거리 하나 꺼내기 (10% 확률로 SAFE_DISTANCE보다 가까움)"""
+    global _sim_distances, _sim_distance_idx
+    if _sim_distance_idx == SIM_BATCH:
+        if _rng is not None:
+            _sim_distances = np.where(
+                _rng.random(SIM_BATCH) < 0.1,
+                _rng.integers(5, SAFE_DISTANCE, SIM_BATCH),  # SAFE_DISTANCE보다 작은 값
+                _rng.integers(SAFE_DISTANCE + 10, 101, SIM_BATCH),  # 충분히 큰 값
+            ).tolist()
+        else:
+            _sim_distances = [
+                random.randrange(5, SAFE_DISTANCE)
+                if random.random() < 0.1
+                else random.randrange(SAFE_DISTANCE + 10, 101)
+                for _ in range(SIM_BATCH)
+            ]
+        _sim_distance_idx = 0
+    distance = _sim_distances[_sim_distance_idx]
+    _sim_distance_idx += 1
+    return distance
+
+
+# 라인 위치가 바뀌면 깨우는 소켓 쌍 (센서 쪽이 쓰고, 메인 루프가 select로 기다림)
+_wake_r, _wake_w = socket.socketpair()
+_wake_r.setblocking(False)
+_wake_w.setblocking(False)
+
+
+def _wake_main():
+    """메인 루프 깨우기 (어느 스레드에서 불러도 됨)"""
+    try:
+        _wake_w.send(b"\0")
+    except BlockingIOError:
+        pass  # 이미 깨울 신호가 잔뜩 쌓여 있음
 
-def read_line():
-    """라인 위치 읽기"""
-    if line_sensor:
-        line_info = line_sensor.get_line_position()
-        position = line_info["position"]
+
+def _drain_wakeups():
+    """쌓인 깨우기 신호 모두 비우기"""
+    try:
+        while _wake_r.recv(64):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def watch_line_edges(hw, sensors):
+    """
+    라인 센서 3개 핀이 바뀌면 바로 sensors.update_line() 호출 (시뮬레이션이면 안 함)
+    등록한 핀 목록을 반환합니다. 엣지 감지를 못 쓰면 빈 튜플을 반환하고,
+    메인 루프는 DISTANCE_CHECK_INTERVAL마다 확인하는 방식으로 동작합니다.
+    """
+    if not hw.line_sensor:
+        return ()
+    # gpiod line request가 핀을 잡고 있으면 엣지 감지 등록이 실패하므로 먼저 놓아줌
+    hw.line_sensor.release_lines()
+    watched = []
+    try:
+        for pin in (
+            hw.line_sensor.LINE_PIN_LEFT,
+            hw.line_sensor.LINE_PIN_MIDDLE,
+            hw.line_sensor.LINE_PIN_RIGHT,
+        ):
+            GPIO.add_event_detect(
+                pin, GPIO.BOTH, callback=lambda channel: sensors.update_line()
+            )
+            watched.append(pin)
+    except RuntimeError as e:
+        # 커널에 따라, 또는 핀을 다른 곳에서 이미 잡고 있으면 실패함
+        print(f"⚠️ 라인 엣지 감지 사용 불가 ({e}) - {DISTANCE_CHECK_INTERVAL}초마다 확인")
+        unwatch_line_edges(watched)
+        hw.line_sensor.request_lines()  # 엣지 감지를 못 쓰면 다시 한 번에 읽기
+        return ()
+    return tuple(watched)
+
+
+def unwatch_line_edges(pins):
+    """watch_line_edges로 등록한 엣지 감지 해제"""
+    for pin in pins:
+        try:
+            GPIO.remove_event_detect(pin)
+        except RuntimeError:
+            pass
+
+
+# get_line_position_fast가 결과를 쓰는 버퍼 (매번 새로 만들지 않음)
+# 센서 스레드와 엣지 콜백이 함께 쓰므로 SensorThread._line_lock 안에서만 사용
+_line_buf = [None]
+
+
+def read_line(hw):
+    """
+    라인 위치 읽기 (LinePos 반환)
+    _line_buf를 쓰므로 SensorThread.update_line()의 _line_lock 안에서 부르세요
+    """
+    if hw.line_sensor:
+        hw.line_sensor.get_line_position_fast(_line_buf)
+        position = _line_buf[0]
 
         if position is None:
-            return "center"
+            return LinePos.CENTER
         elif position < -0.3:
-            return "left"
+            return LinePos.LEFT
         elif position > 0.3:
-            return "right"
+            return LinePos.RIGHT
         else:
-            return "center"
+            return LinePos.CENTER
     else:
         # 시뮬레이션
-        import random
-
-        return random.choice(["left", "center", "right", "none"])
+        return _next_sim_line()
 
 
-def read_distance():
+def read_distance(hw):
     """앞의 거리 읽기"""
-    if ultrasonic:
-        distance = ultrasonic.measure_distance()
-        print(f"---------거리: {distance}")
+    if hw.ultrasonic:
+        distance = hw.ultrasonic.measure_distance()
         return distance if distance else 999
     else:
         # 시뮬레이션
-        import random
+        return _next_sim_distance()
+
+
+class SensorThread(threading.Thread):
+    """
+    센서를 따로 읽어서 최신 값만 보관하는 스레드
+    drive()는 line, dist 값을 꺼내 쓰기만 해서 초음파 측정을 기다리지 않음
+    """
+
+    def __init__(self, hw):
+        super().__init__(daemon=True)
+        self.hw = hw
+        self.line = LinePos.CENTER
+        self.dist = 999
+        self._line_lock = threading.Lock()  # 읽기 + 저장을 한 번에 (두 스레드가 부름)
+        self.stopped = threading.Event()
+        self.error = None  # 센서를 읽다가 난 오류 (있으면 스레드가 멈춘 것)
+        self.updated = time.monotonic()  # 마지막으로 값을 읽은 시각
+
+    def update_line(self):
+        """라인 위치를 새로 읽고, 바뀌었으면 메인 루프 깨우기"""
+        with self._line_lock:
+            line = read_line(self.hw)
+            changed = line != self.line
+            self.line = line
+        if changed:
+            _wake_main()
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                self.update_line()
+                self.dist = read_distance(self.hw)
+                self.updated = time.monotonic()
+                self.stopped.wait(SENSOR_INTERVAL)
+        except Exception as e:
+            # 오류를 남겨 두고 메인 루프를 깨워서 check()에서 알아채게 함
+            self.error = e
+            _wake_main()
 
-        if random.random() < 0.1:  # 10% 확률로 장애물
-            distance = random.randint(5, SAFE_DISTANCE - 1)  # SAFE_DISTANCE보다 작은 값
-            print(f"---------시뮬레이션 장애물 거리: {distance}cm")
-            return distance
-        else:
-            distance = random.randint(
-                SAFE_DISTANCE + 10, 100
-            )  # SAFE_DISTANCE보다 충분히 큰 값
-            print(f"---------시뮬레이션 안전 거리: {distance}cm")
-            return distance
+    def check(self):
+        """스레드가 오류로 멈췄거나 값이 오래됐으면 예외 (main에서 차를 세움)"""
+        if self.error is not None:
+            raise RuntimeError(f"센서 스레드 오류: {self.error}")
+        if time.monotonic() - self.updated > SENSOR_TIMEOUT:
+            raise RuntimeError(f"센서 값이 {SENSOR_TIMEOUT}초 넘게 갱신되지 않음")
 
+    def stop(self):
+        """스레드 끝내기"""
+        self.stopped.set()
+        self.join()
 
-def stop():
+
+def stop(hw):
     """정지"""
-    if motor:
-        motor.motor_stop()
+    if hw.motor:
+        hw.motor.motor_stop()
         print("⏹️ 정지")
     else:
         print("시뮬레이션: 정지")
 
 
-def go_forward():
+def go_forward(hw):
     """직진"""
-    if motor:
-        motor.set_motor_speed("A", FORWARD_SPEED)  # 오른쪽
-        motor.set_motor_speed("B", FORWARD_SPEED)  # 왼쪽
+    if hw.motor:
+        hw.motor.set_motor_speed(CH_R, FORWARD_SPEED)  # 오른쪽
+        hw.motor.set_motor_speed(CH_L, FORWARD_SPEED)  # 왼쪽
         print("⬆️ 직진")
     else:
         print("시뮬레이션: 직진")
 
 
-def turn_left():
+def turn_left(hw):
     """좌회전"""
-    if motor:
-        motor.set_motor_speed("A", HIGH_TURN_SPEED)  # 오른쪽: 앞으로
-        motor.set_motor_speed("B", -LOW_TURN_SPEED)  # 왼쪽: 뒤로
+    if hw.motor:
+        hw.motor.set_motor_speed(CH_R, HIGH_TURN_SPEED)  # 오른쪽: 앞으로
+        hw.motor.set_motor_speed(CH_L, -LOW_TURN_SPEED)  # 왼쪽: 뒤로
         print("⬅️ 좌회전")
     else:
         print("시뮬레이션: 좌회전")
 
 
-def turn_right():
+def turn_right(hw):
     """우회전"""
-    if motor:
-        motor.set_motor_speed("A", -LOW_TURN_SPEED)  # 오른쪽: 뒤로
-        motor.set_motor_speed("B", HIGH_TURN_SPEED)  # 왼쪽: 앞으로
+    if hw.motor:
+        hw.motor.set_motor_speed(CH_R, -LOW_TURN_SPEED)  # 오른쪽: 뒤로
+        hw.motor.set_motor_speed(CH_L, HIGH_TURN_SPEED)  # 왼쪽: 앞으로
         print("➡️ 우회전")
     else:
         print("시뮬레이션: 우회전")
 
 
-def avoid_obstacle():
+def avoid_obstacle(hw):
     """장애물 피하기 (좌회전 → 직진 → 우회전)"""
     print("🚨 장애물 피하기 시작!")
 
     # 1단계: 좌회전
     print("  1. 좌회전으로 피하기")
-    turn_left()
+    turn_left(hw)
     time.sleep(AVOID_TIME)
 
     # 2단계: 직진으로 지나가기
     print("  2. 직진으로 지나가기")
-    go_forward()
+    go_forward(hw)
     time.sleep(AVOID_TIME)
 
     # 3단계: 우회전으로 원래 방향
     print("  3. 우회전으로 복귀")
-    turn_right()
+    turn_right(hw)
     time.sleep(AVOID_TIME)
 
     print("✅ 장애물 피하기 완료!")
 
 
-def drive():
+# 동작 번호 (decide 반환값)
+ACTION_FORWARD = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_AVOID = 3
+
+# 동작 번호 → 동작 함수 표
+ACTIONS = (go_forward, turn_left, turn_right, avoid_obstacle)
+
+
+@njit(cache=True)
+def decide(line_pos, distance, safe_distance):
+    """
+    센서 값으로 동작 번호 결정 (정수/실수만 다루는 순수 함수)
+    모듈의 정수 상수는 numba가 컴파일할 때 값으로 바꿔 넣음
+    :param line_pos: LinePos 값
+    :param distance: 앞 거리 (cm)
+    :param safe_distance: 장애물 안전 거리 (cm)
+    :return: ACTION_* 번호
+    """
+    if distance < safe_distance:
+        return ACTION_AVOID  # 장애물이 가까우면 피하기
+    if line_pos == LinePos.LEFT:
+        return ACTION_RIGHT  # 라인이 왼쪽에 있으니 오른쪽으로
+    if line_pos == LinePos.CENTER:
+        return ACTION_FORWARD
+    return ACTION_LEFT  # 라인이 오른쪽에 있거나 없으면 왼쪽으로
+
+
+def drive(hw, sensors):
     """메인 주행 함수"""
-    # 1단계: 장애물 확인
-    distance = read_distance()
-
-    if distance < SAFE_DISTANCE:
-        # 장애물이 가까우면 피하기
-        avoid_obstacle()
-        return
+    # 1단계: 센서 스레드가 읽어 둔 최신 값 가져오기
+    distance = sensors.dist
+    line_position = sensors.line
+    print(f"---------거리: {distance}cm, 라인 위치: {LINE_LABELS[line_position]} ---------")
 
-    # 2단계: 라인 추적
-    line_position = read_line()
-    print(f"---------라인 위치: {line_position} ----------------")
+    # 2단계: 판단 후 동작
+    ACTIONS[decide(int(line_position), distance, SAFE_DISTANCE)](hw)
 
-    if line_position == "center":
-        go_forward()
-    elif line_position == "left":
-        turn_right()  # 라인이 왼쪽에 있으니 오른쪽으로
-    elif line_position == "right":
-        turn_left()  # 라인이 오른쪽에 있으니 왼쪽으로
-    else:  # none
-        turn_left()  # 라인을 찾기 위해 천천히 회전
 
-
-def cleanup():
+def cleanup(hw):
     """정리"""
     try:
-        stop()
-        if line_sensor:
-            line_sensor.cleanup()
-        if motor:
-            motor.cleanup()
-        if ultrasonic:
-            ultrasonic.cleanup()
+        stop(hw)
+        if hw.line_sensor:
+            hw.line_sensor.cleanup()
+        if hw.motor:
+            hw.motor.cleanup()
+        if hw.ultrasonic:
+            hw.ultrasonic.cleanup()
         print("✓ 정리 완료")
     except:
         pass
@@ -216,24 +434,41 @@ def main():
     print(f"  안전 거리: {SAFE_DISTANCE}cm")
     print("=" * 30)
 
-    if not setup():
+    hw = setup()
+    if hw is None:
         print("❌ 준비 실패")
         return
 
     print("\n🚀 자율 주행 시작!")
     print("Ctrl+C로 멈출 수 있습니다")
 
+    # 센서 스레드는 실시간 모드 전에 시작 (초음파 대기 루프가 주행 코어를 잡지 않도록)
+    sensors = SensorThread(hw)
+    sensors.start()
+    saved_scheduling = enable_realtime()  # 우선순위/코어 설정은 _realtime.py
+    selector = selectors.DefaultSelector()  # 리눅스에서는 epoll
+    selector.register(_wake_r, selectors.EVENT_READ)
+    edge_pins = ()
+
     try:
+        edge_pins = watch_line_edges(hw, sensors)
         while True:
-            drive()
-            time.sleep(0.1)  # 잠시 대기
+            sensors.check()  # 멈춘 센서 값으로 계속 달리지 않도록
+            drive(hw, sensors)
+            # 라인이 바뀌면 바로 깨어나고, 아니면 거리 확인 간격만큼 대기
+            if selector.select(DISTANCE_CHECK_INTERVAL):
+                _drain_wakeups()
 
     except KeyboardInterrupt:
         print("\n\n⌨️ 사용자가 중단했습니다")
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
     finally:
-        cleanup()
+        selector.close()
+        unwatch_line_edges(edge_pins)
+        sensors.stop()
+        cleanup(hw)
+        restore_scheduling(saved_scheduling)
         print("👋 프로그램 종료")
 
 
@@ -12,326 +12,220 @@ Ultra Simple Autonomous Car v3 Improved for High School Students
 """
 
 import time
+from functools import lru_cache
 
-# 하드웨어 가져오기
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# numba가 있으면 로터리 판단 함수를 기계어로 컴파일 (없으면 그냥 파이썬으로 실행)
 try:
-    from hardware.test_line_sensors import LineSensorController
-    from hardware.test_gear_motors import GearMotorController
-    from hardware.test_ultrasonic_sensor import UltrasonicSensor
-
-    print("✓ 실제 하드웨어 사용")
-    SIMULATION = False
+    from numba import njit
 except ImportError:
-    print("⚠️ 시뮬레이션 모드")
-    SIMULATION = True
 
-# ==================== 설정값 ====================
-# 기본 주행 속도
-FORWARD_SPEED = 80  # 직진 속도
+    def njit(*args, **kwargs):
+        return lambda func: func
 
-# 좌회전 세부 설정
-LEFT_TURN_RIGHT_MOTOR = 100  # 좌회전시 우측 모터 (높은 속도)
-LEFT_TURN_LEFT_MOTOR = 30  # 좌회전시 좌측 모터 (낮은 속도)
 
-# 우회전 세부 설정
-RIGHT_TURN_LEFT_MOTOR = 100  # 우회전시 좌측 모터 (높은 속도)
-RIGHT_TURN_RIGHT_MOTOR = 30  # 우회전시 우측 모터 (낮은 속도)
-
-# 장애물 회피 설정
-SAFE_DISTANCE = 15  # 장애물 안전 거리 (cm)
-AVOID_TIME = 0.8  # 회피 동작 시간 (초)
+import _common
+from _common import (
+    LINE_CENTER,
+    LINE_LABELS,
+    LINE_LEFT,
+    LINE_NONE,
+    LINE_RIGHT,
+    ROTARY_SAFE_SPEED,
+    _dbg,
+    run,
+    show_settings,
+)
 
 # 로터리 감지 설정 (개선된 알고리즘!)
 ROTARY_CHECK_SAMPLES = 4  # 체크할 샘플 수 (8번 측정으로 증가)
 ROTARY_SAME_DIRECTION_THRESHOLD = 2  # 같은 방향 연속 임계값 (4번 이상)
 ROTARY_NON_CENTER_RATIO = 0.7  # 비중앙 비율 (8번 중 5번 이상, 70%)
-ROTARY_SAFE_SPEED = 40  # 로터리에서 안전 속도
 ROTARY_DURATION = 4.0  # 로터리 모드 지속 시간 (초)
 
-# 하드웨어 객체들
-line_sensor = None
-motor = None
-ultrasonic = None
+# 시뮬레이션에서 로터리 구간에 나오는 라인 패턴
+_ROTARY_LINES = (LINE_LEFT, LINE_RIGHT, LINE_LEFT, LINE_NONE, LINE_RIGHT)
+
+# 샘플 창 비트 마스크 (샘플 하나 = 2비트 칸, 0번 칸이 가장 최근 샘플)
+_WINDOW_MASK = (1 << (2 * ROTARY_CHECK_SAMPLES)) - 1
+
+# 로터리 감지 사유 번호 (classify 반환값, 출력할 때만 문장으로 바꿈)
+REASON_NONE, REASON_CONSECUTIVE, REASON_NON_CENTER, REASON_CHANGE = range(4)
 
 # 로터리 감지용 변수들 (개선된 시스템)
-line_samples = []  # 최근 8번의 라인 상태 저장
+window = 0  # 최근 8번의 라인 상태 (2비트씩)
+window_count = 0  # 창에 쌓인 샘플 수
 rotary_mode = False
 rotary_start_time = 0
+last_sample = None  # 지난 틱의 라인 상태 (같은 값이 반복되면 분석 생략)
 
 
-def setup():
-    """하드웨어 준비"""
-    global line_sensor, motor, ultrasonic
+@njit(cache=True)
+def _count_bits(x):
+    """1인 비트 개수 (numba에서도 쓸 수 있게 정수 연산만 사용)"""
+    count = 0
+    while x:
+        x &= x - 1  # 가장 낮은 1 비트 지우기
+        count += 1
+    return count
 
-    if not SIMULATION:
-        try:
-            line_sensor = LineSensorController()
-            motor = GearMotorController()
-            ultrasonic = UltrasonicSensor()
-            print("✓ 하드웨어 준비 완료")
-            return True
-        except Exception as e:
-            print(f"❌ 하드웨어 오류: {e}")
-            return False
-    else:
-        print("✓ 시뮬레이션 준비 완료")
-        return True
 
+@njit(cache=True)
+def window_stats(window, n):
+    """
+    샘플 창 분석 (정수 연산만 사용)
 
-def read_line():
-    """라인 위치 읽기"""
-    if line_sensor:
-        line_info = line_sensor.get_line_position()
-        position = line_info["position"]
-
-        if position is None:
-            return "none"
-        elif position < -0.3:
-            return "left"
-        elif position > 0.3:
-            return "right"
-        else:
-            return "center"
-    else:
-        # 시뮬레이션 (로터리 시뮬레이션 포함)
-        import random
-
-        # 로터리 시뮬레이션: 주기적으로 복잡한 패턴 생성
-        if random.random() < 0.12:  # 12% 확률로 로터리 시뮬레이션
-            # 로터리에서는 left/right가 많이 나옴
-            return random.choice(["left", "right", "left", "none", "right"])
-        else:
-            # 일반 도로: center가 많음
-            weights = [15, 60, 15, 10]  # center가 가장 높은 확률
-            return random.choices(["left", "center", "right", "none"], weights=weights)[
-                0
-            ]
-
-
-def read_distance():
-    """앞의 거리 읽기"""
-    if ultrasonic:
-        distance = ultrasonic.measure_distance()
-        return distance if distance else 999
+    반환: (최대 연속 횟수, 연속 방향 칸의 비트 위치, 비중앙 개수, 변화 횟수)
+    """
+    lane_low = 0  # 각 칸의 아래 비트
+    for _ in range(n):
+        lane_low = (lane_low << 2) | 1
+    pair_low = lane_low >> 2  # 이웃 샘플 쌍 (n-1칸)
+
+    # 한 칸 밀어서 XOR: 이웃 샘플과 다른 칸만 0이 아님
+    diff = window ^ (window >> 2)
+    changed = (diff | (diff >> 1)) & pair_low
+    changes = _count_bits(changed)
+    # center 칸과 XOR 해서 0이 아닌 칸이 비중앙
+    off_center = window ^ (lane_low * LINE_CENTER)
+    non_center_count = _count_bits((off_center | (off_center >> 1)) & lane_low)
+
+    # 연속 같은 방향 (left=00, right=10 이라 아래 비트가 0인 칸)
+    runs = pair_low & ~changed & ~window
+    max_consecutive = 1
+    last_runs = 0
+    while runs:
+        # 이웃 칸과 AND 할 때마다 가장 긴 연속 구간이 한 칸씩 줄어듦
+        max_consecutive += 1
+        last_runs = runs
+        runs &= runs >> 2
+    if last_runs:
+        # 가장 긴 구간 중 가장 위쪽 비트 (같으면 더 오래된 쪽)
+        shift = 0
+        while last_runs > 1:
+            last_runs >>= 1
+            shift += 1
     else:
-        # 시뮬레이션
-        import random
+        shift = 2 * (n - 1)  # 연속 없음: 가장 오래된 샘플
+    return max_consecutive, shift, non_center_count, changes
 
-        if random.random() < 0.06:  # 6% 확률로 장애물
-            distance = random.randint(5, SAFE_DISTANCE - 1)
-            return distance
-        else:
-            return random.randint(SAFE_DISTANCE + 10, 100)
 
-
-def check_rotary_improved(current_line):
+@lru_cache(maxsize=4**ROTARY_CHECK_SAMPLES)  # 가능한 창 개수만큼
+def analyze_window(window, n):
     """
-    개선된 로터리 감지 알고리즘
+    샘플 창 분석 결과를 출력용으로 정리 (같은 창이면 캐시된 결과를 그대로 사용)
 
-    원리:
-    1. 최근 8번의 라인 상태를 저장
-    2. 연속 같은 방향 감지 (left 연속 4번 등)
-    3. 비중앙 비율 계산 (center가 아닌 비율)
-    4. 두 조건 중 하나라도 만족하면 로터리
+    반환: (최대 연속 횟수, 연속 방향, 비중앙 개수, 변화 횟수)
     """
-    global line_samples, rotary_mode, rotary_start_time
-
-    # 최근 8번의 샘플 유지
-    line_samples.append(current_line)
-    if len(line_samples) > ROTARY_CHECK_SAMPLES:
-        line_samples.pop(0)  # 가장 오래된 것 제거
+    max_consecutive, shift, non_center_count, changes = window_stats(window, n)
+    direction = LINE_LABELS[(window >> shift) & 3]
+    return max_consecutive, direction, non_center_count, changes
 
-    # 충분한 샘플이 없으면 일반 모드
-    if len(line_samples) < ROTARY_CHECK_SAMPLES:
-        return False
 
-    # 분석 1: 연속 같은 방향 감지
-    max_consecutive = 0
-    current_consecutive = 1
-    consecutive_direction = None
-
-    for i in range(1, len(line_samples)):
-        if line_samples[i] == line_samples[i - 1] and line_samples[i] in [
-            "left",
-            "right",
-        ]:
-            current_consecutive += 1
-        else:
-            if current_consecutive > max_consecutive:
-                max_consecutive = current_consecutive
-                consecutive_direction = line_samples[i - 1]
-            current_consecutive = 1
-
-    # 마지막 연속 체크
-    if current_consecutive > max_consecutive:
-        max_consecutive = current_consecutive
-        consecutive_direction = line_samples[-1]
-
-    # 분석 2: 비중앙 비율 계산
-    non_center_count = sum(1 for sample in line_samples if sample != "center")
-    non_center_ratio = non_center_count / len(line_samples)
-
-    # 분석 3: 변화 횟수 계산 (기존 방식도 유지)
-    changes = sum(
-        1 for i in range(1, len(line_samples)) if line_samples[i] != line_samples[i - 1]
-    )
-    change_ratio = changes / (len(line_samples) - 1)
+@lru_cache(maxsize=4**ROTARY_CHECK_SAMPLES)
+def classify(window, n):
+    """
+    샘플 창이 로터리인지 판단 (4칸이면 창이 256가지뿐이라 금방 모두 캐시됨)
+    캐시가 있으니 이 함수는 그냥 파이썬으로 둠 (계산은 window_stats가 함)
 
-    # 디버그 출력
-    print(f"  📊 로터리 분석:")
-    print(
-        f"     연속: {max_consecutive}회 {consecutive_direction} ({'⚠️' if max_consecutive >= ROTARY_SAME_DIRECTION_THRESHOLD else '✓'})"
-    )
-    print(
-        f"     비중앙: {non_center_count}/{len(line_samples)} = {non_center_ratio:.2f} ({'⚠️' if non_center_ratio >= ROTARY_NON_CENTER_RATIO else '✓'})"
-    )
-    print(f"     변화: {changes}/{len(line_samples)-1} = {change_ratio:.2f}")
+    반환: (로터리 여부, 감지 사유 번호 REASON_*)
+    """
+    max_consecutive, shift, non_center_count, changes = window_stats(window, n)
 
     # 로터리 감지 조건 (3가지 중 하나라도 만족)
-    rotary_detected = False
-    detection_reason = ""
-
     if max_consecutive >= ROTARY_SAME_DIRECTION_THRESHOLD:
-        rotary_detected = True
-        detection_reason = f"연속 {consecutive_direction} {max_consecutive}회"
-    elif non_center_ratio >= ROTARY_NON_CENTER_RATIO:
-        rotary_detected = True
-        detection_reason = f"비중앙 비율 {non_center_ratio:.1%}"
-    elif change_ratio >= 0.6:  # 변화율도 추가 조건
-        rotary_detected = True
-        detection_reason = f"변화율 {change_ratio:.1%}"
-
-    # 로터리 시작
-    if rotary_detected and not rotary_mode:
-        rotary_mode = True
-        rotary_start_time = time.time()
-        line_samples.clear()  # 샘플 리셋
-        print(f"🌀 로터리 감지! 사유: {detection_reason}")
-        return True
+        return True, REASON_CONSECUTIVE
+    if non_center_count / n >= ROTARY_NON_CENTER_RATIO:
+        return True, REASON_NON_CENTER
+    if changes / (n - 1) >= 0.6:  # 변화율도 추가 조건
+        return True, REASON_CHANGE
+    return False, REASON_NONE
 
-    # 로터리 모드 해제 조건
-    if rotary_mode and (time.time() - rotary_start_time) > ROTARY_DURATION:
-        rotary_mode = False
-        line_samples.clear()  # 샘플 리셋
-        print("✅ 로터리 통과 완료! 정상 모드 복귀")
-        return False
 
-    return rotary_mode
+def reason_text(reason, window, n):
+    """감지 사유 번호를 출력용 문장으로 바꾸기"""
+    max_consecutive, direction, non_center_count, changes = analyze_window(window, n)
+    if reason == REASON_CONSECUTIVE:
+        return f"연속 {direction} {max_consecutive}회"
+    if reason == REASON_NON_CENTER:
+        return f"비중앙 비율 {non_center_count / n:.1%}"
+    return f"변화율 {changes / (n - 1):.1%}"
 
 
-def stop():
-    """정지"""
-    if motor:
-        motor.motor_stop()
-        print("⏹️ 정지")
-    else:
-        print("시뮬레이션: 정지")
+def check_rotary_improved(current_line):
+    """
+    개선된 로터리 감지 알고리즘
 
+    원리:
+    1. 최근 샘플들의 라인 상태를 정수 하나(window)에 2비트씩 저장
+    2. 연속 같은 방향 감지 (left 연속 등)
+    3. 비중앙 비율 계산 (center가 아닌 비율)
+    4. 조건 중 하나라도 만족하면 로터리 (판단은 classify가 창별로 캐시)
+    """
+    global window, window_count, rotary_mode, rotary_start_time, last_sample
+
+    # 로터리 모드 중에는 감지 결과를 쓰지 않으므로 분석 없이
+    # 샘플 수만 다시 채우고 (다 찰 때까지는 일반 모드) 지속 시간 확인
+    if rotary_mode:
+        if window_count < ROTARY_CHECK_SAMPLES:
+            window_count += 1
+            if window_count < ROTARY_CHECK_SAMPLES:
+                return False
+        if (time.time() - rotary_start_time) > ROTARY_DURATION:
+            rotary_mode = False
+            window = window_count = 0  # 샘플 리셋
+            last_sample = None
+            print("✅ 로터리 통과 완료! 정상 모드 복귀")
+            return False
+        return True
 
-def go_forward(speed=None):
-    """직진"""
-    speed = speed or FORWARD_SPEED
-    if motor:
-        motor.set_motor_speed("A", speed)  # 오른쪽
-        motor.set_motor_speed("B", speed)  # 왼쪽
-        print(f"⬆️ 직진 (속도: {speed})")
-    else:
-        print(f"시뮬레이션: 직진 (속도: {speed})")
+    # 창이 이미 차 있는데 로터리가 아니었다면 지난 분석은 '일반'이었음
+    # center가 또 들어오면 연속/비중앙/변화가 모두 늘 수 없으니 분석 생략
+    repeated = (
+        current_line == last_sample == LINE_CENTER
+        and window_count == ROTARY_CHECK_SAMPLES
+    )
+    last_sample = current_line
 
+    # 새 샘플을 밀어 넣고 가장 오래된 칸은 마스크로 버리기
+    window = ((window << 2) | current_line) & _WINDOW_MASK
+    if repeated:
+        return False
+    if window_count < ROTARY_CHECK_SAMPLES:
+        window_count += 1
 
-def turn_left():
-    """좌회전 (개별 속도 설정)"""
-    if motor:
-        motor.set_motor_speed("A", LEFT_TURN_RIGHT_MOTOR)  # 오른쪽: 높은 속도
-        motor.set_motor_speed("B", -LEFT_TURN_LEFT_MOTOR)  # 왼쪽: 낮은 속도 후진
-        print(f"⬅️ 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})")
-    else:
-        print(
-            f"시뮬레이션: 좌회전 (우측:{LEFT_TURN_RIGHT_MOTOR}, 좌측:-{LEFT_TURN_LEFT_MOTOR})"
-        )
+    # 충분한 샘플이 없으면 일반 모드
+    if window_count < ROTARY_CHECK_SAMPLES:
+        return False
 
+    rotary_detected, reason = classify(window, ROTARY_CHECK_SAMPLES)
 
-def turn_right():
-    """우회전 (개별 속도 설정)"""
-    if motor:
-        motor.set_motor_speed("A", -RIGHT_TURN_RIGHT_MOTOR)  # 오른쪽: 낮은 속도 후진
-        motor.set_motor_speed("B", RIGHT_TURN_LEFT_MOTOR)  # 왼쪽: 높은 속도
-        print(
-            f"➡️ 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})"
+    # 디버그 출력 (상태가 바뀔 때의 출력은 아래에서 항상 함)
+    if _common.DEBUG:  # 속성으로 읽어야 나중에 바꾼 값도 반영됨
+        n = ROTARY_CHECK_SAMPLES
+        max_consecutive, direction, non_center_count, changes = analyze_window(
+            window, n
         )
-    else:
-        print(
-            f"시뮬레이션: 우회전 (우측:-{RIGHT_TURN_RIGHT_MOTOR}, 좌측:{RIGHT_TURN_LEFT_MOTOR})"
+        non_center_ratio = non_center_count / n
+        _dbg("  📊 로터리 분석:")
+        _dbg(
+            f"     연속: {max_consecutive}회 {direction} ({'⚠️' if max_consecutive >= ROTARY_SAME_DIRECTION_THRESHOLD else '✓'})"
         )
+        _dbg(
+            f"     비중앙: {non_center_count}/{n} = {non_center_ratio:.2f} ({'⚠️' if non_center_ratio >= ROTARY_NON_CENTER_RATIO else '✓'})"
+        )
+        _dbg(f"     변화: {changes}/{n-1} = {changes / (n - 1):.2f}")
 
+    # 로터리 시작
+    if rotary_detected:
+        rotary_mode = True
+        rotary_start_time = time.time()
+        detection_reason = reason_text(reason, window, ROTARY_CHECK_SAMPLES)
+        window = window_count = 0  # 샘플 리셋
+        last_sample = None
+        print(f"🌀 로터리 감지! 사유: {detection_reason}")
+        return True
 
-def avoid_obstacle():
-    """장애물 피하기 (좌회전 → 직진 → 우회전)"""
-    print("🚨 장애물 회피 시작!")
-
-    # 1단계: 좌회전
-    print("  1. 좌회전으로 피하기")
-    turn_left()
-    time.sleep(AVOID_TIME)
-
-    # 2단계: 직진으로 지나가기
-    print("  2. 직진으로 지나가기")
-    go_forward()
-    time.sleep(AVOID_TIME)
-
-    # 3단계: 우회전으로 원래 방향
-    print("  3. 우회전으로 복귀")
-    turn_right()
-    time.sleep(AVOID_TIME)
-
-    print("✅ 장애물 회피 완료!")
-
-
-def smart_drive():
-    """스마트 주행 (모든 기능 통합)"""
-    # 1단계: 장애물 확인 (최우선)
-    distance = read_distance()
-    if distance < SAFE_DISTANCE:
-        print(f"🚨 장애물 감지: {distance}cm")
-        avoid_obstacle()
-        return
-
-    # 2단계: 라인 읽기
-    line_position = read_line()
-
-    # 3단계: 개선된 로터리 감지
-    is_rotary = check_rotary_improved(line_position)
-
-    # 4단계: 주행 모드 결정
-    if is_rotary:
-        # 로터리 모드: 안전하게 천천히
-        print(f"🌀 로터리 안전 주행: {line_position}")
-        if line_position == "center":
-            go_forward(ROTARY_SAFE_SPEED)
-        elif line_position == "left":
-            # 로터리에서는 부드럽게 회전
-            go_forward(ROTARY_SAFE_SPEED // 2)
-        elif line_position == "right":
-            # 로터리에서는 부드럽게 회전
-            go_forward(ROTARY_SAFE_SPEED // 2)
-        else:  # none
-            # 라인이 없어도 천천히 직진 (로터리 특성)
-            go_forward(ROTARY_SAFE_SPEED // 3)
-    else:
-        # 일반 모드: 정상 속도로 라인 추적
-        if line_position == "center":
-            go_forward()
-        elif line_position == "left":
-            turn_right()
-        elif line_position == "right":
-            turn_left()
-        else:  # none
-            turn_left()  # 라인 찾기
+    return False
 
 
 def show_algorithm_info():
@@ -362,52 +256,8 @@ def show_algorithm_info():
     print("=" * 70)
 
 
-def show_settings():
-    """현재 설정 표시"""
-    print("\n" + "=" * 50)
-    print("🚗 초간단 자율 주행차 v3 개선판 설정")
-    print("=" * 50)
-    print("📈 기본 속도:")
-    print(f"  직진 속도: {FORWARD_SPEED}")
-    print()
-    print("🔄 회전 속도 (개별 설정):")
-    print(
-        f"  좌회전 - 우측모터: {LEFT_TURN_RIGHT_MOTOR}, 좌측모터: {LEFT_TURN_LEFT_MOTOR}"
-    )
-    print(
-        f"  우회전 - 우측모터: {RIGHT_TURN_RIGHT_MOTOR}, 좌측모터: {RIGHT_TURN_LEFT_MOTOR}"
-    )
-    print()
-    print("🛡️ 장애물 회피:")
-    print(f"  안전 거리: {SAFE_DISTANCE}cm")
-    print(f"  회피 시간: {AVOID_TIME}초")
-    print()
-    print("🌀 개선된 로터리 감지:")
-    print(f"  체크 샘플 수: {ROTARY_CHECK_SAMPLES}번")
-    print(f"  연속 임계값: {ROTARY_SAME_DIRECTION_THRESHOLD}번")
-    print(f"  비중앙 비율: {ROTARY_NON_CENTER_RATIO*100}%")
-    print(f"  안전 속도: {ROTARY_SAFE_SPEED}")
-    print(f"  지속 시간: {ROTARY_DURATION}초")
-    print("=" * 50)
-
-
-def cleanup():
-    """정리"""
-    try:
-        stop()
-        if line_sensor:
-            line_sensor.cleanup()
-        if motor:
-            motor.cleanup()
-        if ultrasonic:
-            ultrasonic.cleanup()
-        print("✓ 정리 완료")
-    except:
-        pass
-
-
-def main():
-    """메인 함수 - 바로 실행!"""
+def show_info():
+    """시작할 때 기능, 설정, 알고리즘 정보 표시"""
     print("🚗 초간단 자율 주행차 v3 개선판")
     print("=" * 45)
     print("새로운 기능:")
@@ -417,29 +267,29 @@ def main():
     print("=" * 45)
 
     # 설정과 알고리즘 정보 표시
-    show_settings()
+    show_settings(
+        "🚗 초간단 자율 주행차 v3 개선판 설정",
+        "🌀 개선된 로터리 감지:",
+        (
+            f"체크 샘플 수: {ROTARY_CHECK_SAMPLES}번",
+            f"연속 임계값: {ROTARY_SAME_DIRECTION_THRESHOLD}번",
+            f"비중앙 비율: {ROTARY_NON_CENTER_RATIO*100}%",
+            f"안전 속도: {ROTARY_SAFE_SPEED}",
+            f"지속 시간: {ROTARY_DURATION}초",
+        ),
+    )
     show_algorithm_info()
 
-    if not setup():
-        print("❌ 하드웨어 준비 실패")
-        return
-
-    print("\n🚀 개선된 스마트 자율 주행 시작!")
-    print("Ctrl+C로 언제든지 중단할 수 있습니다")
-    print("=" * 50)
-
-    try:
-        while True:
-            smart_drive()
-            time.sleep(0.2)  # 0.2초마다 센서 체크
-
-    except KeyboardInterrupt:
-        print("\n\n⌨️ 사용자가 중단했습니다")
-    except Exception as e:
-        print(f"\n❌ 오류 발생: {e}")
-    finally:
-        cleanup()
-        print("👋 프로그램 종료")
+
+def main():
+    """메인 함수 - 바로 실행!"""
+    run(
+        check_rotary_improved,
+        show_info,
+        start_message="🚀 개선된 스마트 자율 주행 시작!",
+        sim_rotary_prob=0.12,
+        sim_rotary_lines=_ROTARY_LINES,
+    )
 
 
 if __name__ == "__main__":
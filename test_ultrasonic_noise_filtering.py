@@ -27,6 +27,43 @@ except ImportError as e:
     print("autonomous_robot 패키지가 제대로 설치되어 있는지 확인하세요.")
     sys.exit(1)
 
+# 라즈베리파이 환경인지 한 번만 확인 (main()이 다시 불려도 import를 반복하지 않음)
+try:
+    import RPi.GPIO  # 설치되어 있는지만 확인
+
+    IS_RASPBERRY_PI = True
+except ImportError:
+    IS_RASPBERRY_PI = False
+
+# 테스트 설정
+SCENARIO_1_INTERVAL = 1.0  # 시나리오 1 측정 간격 (초)
+SCENARIO_4_INTERVAL = 2.0  # 시나리오 4 측정 간격 (초)
+SCENARIO_PAUSE = 2.0  # 전체 테스트에서 시나리오 사이 쉬는 시간 (초)
+FAST_MODE = "--fast" in sys.argv[1:]  # --fast: 기다리지 않고 측정만 (필터 속도 확인용)
+PRINT_BATCH_SIZE = 5  # 측정 결과를 몇 번마다 모아서 출력할지
+
+
+def write_lines(lines: List[str]) -> None:
+    """모아 둔 출력 줄을 한 번에 쓰고 비우는 함수 (print를 여러 번 부르지 않도록)"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def sleep_until(deadline: float) -> None:
+    """
+    deadline(time.monotonic 기준)까지 기다리는 함수
+
+    측정에 걸린 시간만큼 덜 기다리므로 측정 간격이 일정하게 유지됩니다.
+    FAST_MODE에서는 기다리지 않습니다.
+    """
+    if FAST_MODE:
+        return
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
 # =============================================================================
 # 테스트 시나리오 함수들
 # =============================================================================
@@ -44,20 +81,29 @@ def test_scenario_1_normal_operation():
 
     print("15초 동안 정상 환경에서 거리 측정...")
 
+    lines = []
+    next_time = time.monotonic()
     for i in range(15):
+        next_time += SCENARIO_1_INTERVAL
         # 노이즈 필터링된 측정
         result = get_ultra_reliable_distance_measurement()
 
         if result["distance_cm"] is not None:
-            print(
+            lines.append(
                 f"  측정 {i+1:2d}: {result['distance_cm']:6.1f}cm | "
                 f"신뢰도: {result['confidence_level']:10s} | "
                 f"센서점수: {result['reliability_score']:5.1f}%"
             )
         else:
-            print(f"  측정 {i+1:2d}: 측정 실패")
+            lines.append(f"  측정 {i+1:2d}: 측정 실패")
+
+        # PRINT_BATCH_SIZE번마다 모아서 출력
+        if i % PRINT_BATCH_SIZE == PRINT_BATCH_SIZE - 1:
+            write_lines(lines)
 
-        time.sleep(1)
+        sleep_until(next_time)
+
+    write_lines(lines)
 
     print_detailed_filter_status()
 
@@ -109,25 +155,37 @@ def test_scenario_4_real_robot_integration():
 
     print("실제 장애물 회피 시스템과 연동 테스트...")
 
+    lines = []
+    next_time = time.monotonic()
     for i in range(10):
+        next_time += SCENARIO_4_INTERVAL
+
         # 통합 시스템에서 장애물 상태 확인
         obstacle_status = get_complete_obstacle_status_and_recommendation()
 
-        print(f"\n--- 통합 테스트 {i+1} ---")
-        print(
+        lines.append(f"\n--- 통합 테스트 {i+1} ---")
+        lines.append(
             f"거리: {obstacle_status['distance_cm']:.1f}cm"
             if obstacle_status["distance_cm"]
             else "거리: 측정 실패"
         )
-        print(f"위험도: {obstacle_status['danger_level']}")
-        print(f"추천 동작: {obstacle_status['recommended_action']}")
-        print(f"측정 신뢰도: {obstacle_status['measurement_confidence']}")
-        print(f"센서 상태: {'정상' if obstacle_status['sensor_health'] else '불량'}")
-        print(
+        lines.append(f"위험도: {obstacle_status['danger_level']}")
+        lines.append(f"추천 동작: {obstacle_status['recommended_action']}")
+        lines.append(f"측정 신뢰도: {obstacle_status['measurement_confidence']}")
+        lines.append(
+            f"센서 상태: {'정상' if obstacle_status['sensor_health'] else '불량'}"
+        )
+        lines.append(
             f"노이즈 필터링: {'적용됨' if obstacle_status['noise_filtered'] else '미적용'}"
         )
 
-        time.sleep(2)
+        # PRINT_BATCH_SIZE번마다 모아서 출력
+        if i % PRINT_BATCH_SIZE == PRINT_BATCH_SIZE - 1:
+            write_lines(lines)
+
+        sleep_until(next_time)
+
+    write_lines(lines)
 
     # 자원 정리
     cleanup_ultrasonic_resources()
@@ -152,19 +210,26 @@ def show_test_menu():
 
 
 def run_all_tests():
-    """모든 테스트를 순서대로 실행"""
+    """
+    모든 테스트를 순서대로 실행
+
+    시나리오 1~3은 동시에 실행하면 안 됩니다. 모두 같은 필터 모듈의 전역 상태를
+    초기화(reset_all_filter_systems)하고 고쳐 쓰며, 시나리오 2는 가짜 측정값을
+    그 버퍼에 직접 넣고, 1과 3은 같은 초음파 센서를 읽습니다.
+    기다리는 시간을 줄이려면 --fast 옵션을 사용하세요.
+    """
     print("\n🚀 전체 테스트 시퀀스 시작")
     print("=" * 60)
 
     try:
         test_scenario_1_normal_operation()
-        time.sleep(2)
+        sleep_until(time.monotonic() + SCENARIO_PAUSE)
 
         test_scenario_2_noisy_environment()
-        time.sleep(2)
+        sleep_until(time.monotonic() + SCENARIO_PAUSE)
 
         test_scenario_3_performance_benchmark()
-        time.sleep(2)
+        sleep_until(time.monotonic() + SCENARIO_PAUSE)
 
         test_scenario_4_real_robot_integration()
 
@@ -194,20 +259,34 @@ def check_system_status():
     print_detailed_filter_status()
 
 
+def reset_filter_systems_from_menu():
+    """메뉴에서 필터 시스템 초기화"""
+    reset_all_filter_systems()
+    print("✅ 필터 시스템 초기화 완료")
+
+
+# 메뉴 선택 → 실행할 함수 ('q'는 main에서 따로 처리)
+MENU_ACTIONS = {
+    "1": test_scenario_1_normal_operation,
+    "2": test_scenario_2_noisy_environment,
+    "3": test_scenario_3_performance_benchmark,
+    "4": test_scenario_4_real_robot_integration,
+    "5": run_all_tests,
+    "s": check_system_status,
+    "r": reset_filter_systems_from_menu,
+}
+
+
 def main():
     """메인 함수"""
     print("🤖 초음파 센서 노이즈 필터링 시스템 테스트 프로그램")
     print("=" * 60)
 
-    # 라즈베리파이 환경 확인
-    try:
-        import RPi.GPIO as GPIO
-
+    # 라즈베리파이 환경 확인 (모듈을 불러올 때 한 번만 확인해 둠)
+    if IS_RASPBERRY_PI:
         print("✅ 라즈베리파이 환경 감지")
-        is_raspberry_pi = True
-    except ImportError:
+    else:
         print("⚠️ 라즈베리파이가 아닌 환경 - 시뮬레이션 모드로 실행")
-        is_raspberry_pi = False
 
     # 필터링 시스템 초기화
     reset_all_filter_systems()
@@ -219,25 +298,14 @@ def main():
             show_test_menu()
             choice = input("\n선택: ").strip().lower()
 
-            if choice == "1":
-                test_scenario_1_normal_operation()
-            elif choice == "2":
-                test_scenario_2_noisy_environment()
-            elif choice == "3":
-                test_scenario_3_performance_benchmark()
-            elif choice == "4":
-                test_scenario_4_real_robot_integration()
-            elif choice == "5":
-                run_all_tests()
-            elif choice == "s":
-                check_system_status()
-            elif choice == "r":
-                reset_all_filter_systems()
-                print("✅ 필터 시스템 초기화 완료")
-            elif choice == "q":
+            if choice == "q":
                 break
-            else:
+
+            action = MENU_ACTIONS.get(choice)
+            if action is None:
                 print("❓ 알 수 없는 명령입니다.")
+            else:
+                action()
 
     except KeyboardInterrupt:
         print("\n⚠️ Ctrl+C로 프로그램 종료")